@@ -19,6 +19,8 @@ This module provides functions to parse Google-style docstrings into structured
 from __future__ import annotations
 
 import re
+import sys
+from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from docstring_parser import parse
@@ -34,28 +36,78 @@ from google_docstring_parser.type_validation import (
 
 __all__ = [
     "InvalidTypeAnnotationError",
+    "ReferenceErrorCode",
     "ReferenceFormatError",
     "parse_google_docstring",
 ]
 
 
+# Precompiled regex patterns
+SECTION_HEADER_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9 ]+):$")
+RETURNS_LINE_PATTERN = re.compile(r"^(?:([^:]+):\s*)?(.*)$")
+
+# Sections that are parsed into structured values rather than copied as text
+_STRUCTURED_SECTIONS = frozenset(("Description", "Args", "Returns"))
+
+
+class ReferenceErrorCode(str, Enum):
+    """Codes identifying the specific issue behind a ReferenceFormatError.
+
+    Members are the original string codes (e.g. ``"missing_dash"``), so they compare, hash,
+    format and serialize exactly like them.
+    """
+
+    MISSING_DASH = "missing_dash"
+    DASH_IN_SINGLE = "dash_in_single"
+    MISSING_COLON = "missing_colon"
+    EMPTY_DESCRIPTION = "empty_description"
+
+    def __str__(self) -> str:
+        """Return the string code, as str() does for plain strings.
+
+        Returns:
+            str: The string code
+        """
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        """Format the string code, as f-strings do for plain strings.
+
+        Args:
+            format_spec (str): Format specification
+
+        Returns:
+            str: The formatted string code
+        """
+        return format(self.value, format_spec)
+
+
+# Message templates for reference format errors, keyed by error code
+_REFERENCE_ERROR_MESSAGES = {
+    ReferenceErrorCode.MISSING_DASH: "Multiple references must all start with dash (-)",
+    ReferenceErrorCode.DASH_IN_SINGLE: "Single reference should not start with dash (-)",
+    ReferenceErrorCode.MISSING_COLON: "Invalid reference format, missing colon separator: {line}",
+    ReferenceErrorCode.EMPTY_DESCRIPTION: "Invalid reference format, empty description: {line}",
+}
+
+
 class ReferenceFormatError(ValueError):
     """Error raised when a reference format is invalid.
 
     Args:
-        code (str): Error code identifying the specific format issue
+        code (ReferenceErrorCode | str): Error code identifying the specific format issue. Known string
+            codes such as "missing_dash" are converted to the matching ReferenceErrorCode.
         line (str): The reference line that caused the error (optional)
     """
 
-    def __init__(self, code: str, line: str = "") -> None:
-        messages = {
-            "missing_dash": "Multiple references must all start with dash (-)",
-            "dash_in_single": "Single reference should not start with dash (-)",
-            "missing_colon": f"Invalid reference format, missing colon separator: {line}",
-            "empty_description": f"Invalid reference format, empty description: {line}",
-        }
+    def __init__(self, code: ReferenceErrorCode | str, line: str = "") -> None:
+        if isinstance(code, str) and code in _REFERENCE_ERROR_MESSAGES:
+            code = ReferenceErrorCode(code)
+            message = _REFERENCE_ERROR_MESSAGES[code].format(line=line)
+        else:
+            message = "Reference Format Error"
         self.code = code
-        super().__init__(messages.get(code, "Reference Format Error"))
+        super().__init__(message)
 
 
 # Legacy error classes - kept for backward compatibility
@@ -63,28 +115,28 @@ class MissingDashError(ReferenceFormatError):
     """Error raised when a multiple reference doesn't start with a dash."""
 
     def __init__(self) -> None:
-        super().__init__("missing_dash")
+        super().__init__(ReferenceErrorCode.MISSING_DASH)
 
 
 class DashInSingleReferenceError(ReferenceFormatError):
     """Error raised when a single reference starts with a dash."""
 
     def __init__(self) -> None:
-        super().__init__("dash_in_single")
+        super().__init__(ReferenceErrorCode.DASH_IN_SINGLE)
 
 
 class MissingColonError(ReferenceFormatError):
     """Error raised when a reference is missing a colon separator."""
 
     def __init__(self, line: str) -> None:
-        super().__init__("missing_colon", line)
+        super().__init__(ReferenceErrorCode.MISSING_COLON, line)
 
 
 class EmptyDescriptionError(ReferenceFormatError):
     """Error raised when a reference has an empty description."""
 
     def __init__(self, line: str) -> None:
-        super().__init__("empty_description", line)
+        super().__init__(ReferenceErrorCode.EMPTY_DESCRIPTION, line)
 
 
 def _extract_sections(docstring: str) -> dict[str, str]:
@@ -107,15 +159,15 @@ def _extract_sections(docstring: str) -> dict[str, str]:
         if not (stripped := line.strip()) and not section_content:
             continue
 
-        # Check if this is a section header
-        if section_match := re.match(r"^([A-Za-z][A-Za-z0-9 ]+):$", stripped):
+        # Check if this is a section header; headers always end with a colon
+        if stripped.endswith(":") and (section_match := SECTION_HEADER_PATTERN.match(stripped)):
             # Save previous section content
             if section_content:
                 sections[current_section] = "\n".join(section_content).strip()
                 section_content = []
 
-            # Set new current section
-            current_section = section_match[1]
+            # Set new current section, interned since it is used as a dictionary key
+            current_section = sys.intern(section_match[1])
             indent_level = None
         else:
             # If this is the first content line after a section header, determine indent level
@@ -148,25 +200,18 @@ def _find_separator_colon(content: str) -> int:
         int: The index of the separator colon, or -1 if not found
     """
     # Skip colon in URLs like http://, https://, ftp://, etc.
-    content_parts = content.split("://", 1)
+    protocol, separator, rest = content.partition("://")
 
     # If there was a protocol in the content, look for a colon after the protocol part
-    if len(content_parts) > 1:
-        protocol = content_parts[0]
-        rest = content_parts[1]
-
+    if separator:
         # Search for a colon in the part after the protocol
-        if ":" in rest:
-            return len(protocol) + 3 + rest.index(":")  # 3 is for "://"
+        if (colon_index := rest.find(":")) != -1:
+            return len(protocol) + len(separator) + colon_index
         # If no colon in rest, check for a colon before the protocol (in the description)
-        if ":" in protocol:
-            return protocol.index(":")
-    elif ":" in content:
-        # No protocol found, just find the first colon
-        return content.index(":")
+        return protocol.find(":")
 
-    # No colon found
-    return -1
+    # No protocol found, just find the first colon (-1 if there is none)
+    return content.find(":")
 
 
 def _parse_reference_line(line: str, *, is_single: bool = False) -> dict[str, str]:
@@ -182,26 +227,30 @@ def _parse_reference_line(line: str, *, is_single: bool = False) -> dict[str, st
     Raises:
         ReferenceFormatError: If the reference format is invalid
     """
+    content = line.strip()
+    has_dash = content.startswith("-")
+
     # Check if single reference has a dash (which it shouldn't)
-    if is_single and line.lstrip().startswith("-"):
-        raise ReferenceFormatError("dash_in_single")
+    if is_single and has_dash:
+        raise ReferenceFormatError(ReferenceErrorCode.DASH_IN_SINGLE)
 
     # Remove dash if present
-    content = line[1:].strip() if line.lstrip().startswith("-") else line.strip()
+    if has_dash:
+        content = content[1:].lstrip()
 
     # Find separator colon
     colon_index = _find_separator_colon(content)
 
     # If no valid colon found, raise an error
     if colon_index == -1:
-        raise ReferenceFormatError("missing_colon", line)
+        raise ReferenceFormatError(ReferenceErrorCode.MISSING_COLON, line)
 
     description = content[:colon_index].strip()
     source = content[colon_index + 1 :].strip()
 
     # Make sure the description isn't empty
     if not description:
-        raise ReferenceFormatError("empty_description", line)
+        raise ReferenceFormatError(ReferenceErrorCode.EMPTY_DESCRIPTION, line)
 
     return {
         "description": description,
@@ -263,7 +312,7 @@ def _process_single_reference(main_line: str, all_lines: list[str]) -> dict[str,
     """
     # Single reference - should not have a dash
     if main_line.lstrip().startswith("-"):
-        raise ReferenceFormatError("dash_in_single")
+        raise ReferenceFormatError(ReferenceErrorCode.DASH_IN_SINGLE)
 
     # Process all lines for this reference
     ref_lines = [main_line]
@@ -330,7 +379,7 @@ def _process_multiple_references(lines: list[str]) -> list[dict[str, str]]:
         else:
             # A non-dashed line in a multi-reference context is an error
             # (unless it's a continuation line, which we've already handled)
-            raise ReferenceFormatError("missing_dash")
+            raise ReferenceFormatError(ReferenceErrorCode.MISSING_DASH)
 
         i += 1
 
@@ -359,7 +408,7 @@ def _parse_references(reference_content: str) -> list[dict[str, str]]:
 
     # Validate that multiple references all have dashes
     if len(main_ref_lines) > 1 and not all(line.lstrip().startswith("-") for line in main_ref_lines):
-        raise ReferenceFormatError("missing_dash")
+        raise ReferenceFormatError(ReferenceErrorCode.MISSING_DASH)
 
     # Handle different cases based on number of references
     if len(main_ref_lines) == 1:
@@ -372,17 +421,17 @@ def _parse_references(reference_content: str) -> list[dict[str, str]]:
     return references
 
 
-def _validate_type_with_error_handling(type_str: str, result: dict[str, Any], collect_errors: bool) -> None:
+def _validate_type_with_error_handling(type_str: str, errors: list[str], collect_errors: bool) -> None:
     """Validate a type annotation and handle any errors.
 
     This function validates type annotations and handles errors differently based on the collect_errors flag:
-    - When collect_errors is True: Errors are added to result["errors"] list instead of being raised
+    - When collect_errors is True: Errors are added to the errors list instead of being raised
     - When collect_errors is False: Errors are raised immediately as InvalidTypeAnnotationError
 
     Args:
         type_str (str): The type annotation to validate
-        result (dict[str, Any]): The result dictionary to add errors to when collect_errors is True
-        collect_errors (bool): Whether to collect errors in result["errors"] (True) or raise them (False)
+        errors (list[str]): The list to add errors to when collect_errors is True
+        collect_errors (bool): Whether to collect errors in the errors list (True) or raise them (False)
 
     Returns:
         None
@@ -396,7 +445,7 @@ def _validate_type_with_error_handling(type_str: str, result: dict[str, Any], co
             check_text_for_bare_collections(type_str)
     except InvalidTypeAnnotationError as e:
         if collect_errors:
-            result["errors"].append(str(e))
+            errors.append(str(e))
         else:
             raise
 
@@ -407,7 +456,7 @@ def _process_args_with_validation(
     result: dict[str, Any],
     validate_types: bool,
     collect_errors: bool,
-) -> None:
+) -> list[str]:
     """Process the Args section with type validation.
 
     Args:
@@ -416,26 +465,30 @@ def _process_args_with_validation(
         result (dict[str, Any]): The result dictionary to update
         validate_types (bool): Whether to validate type annotations
         collect_errors (bool): Whether to collect errors or raise them
+
+    Returns:
+        list[str]: Validation errors collected when collect_errors is True
     """
-    if "Args" not in sections:
-        return
-
-    args = [
-        {
-            "name": arg.arg_name.rstrip() if arg.arg_name is not None else None,
-            "type": arg.type_name.rstrip() if arg.type_name is not None else None,
-            "description": arg.description.rstrip() if arg.description is not None else None,
-        }
-        for arg in parsed.params
-    ]
-
-    if not args:
-        return
-
-    for arg in args:
-        if arg["type"] and validate_types:
-            _validate_type_with_error_handling(arg["type"], result, collect_errors)
+    errors: list[str] = []
+    if "Args" not in sections or not parsed.params:
+        return errors
+
+    # Build and validate the args in a single pass over the parsed params.
+    # Names and types repeat across docstrings, so they are interned to share one copy of each.
+    args = []
+    for param in parsed.params:
+        arg_type = sys.intern(param.type_name.rstrip()) if param.type_name is not None else None
+        if arg_type and validate_types:
+            _validate_type_with_error_handling(arg_type, errors, collect_errors)
+        args.append(
+            {
+                "name": sys.intern(param.arg_name.rstrip()) if param.arg_name is not None else None,
+                "type": arg_type,
+                "description": param.description.rstrip() if param.description is not None else None,
+            },
+        )
     result["Args"] = args
+    return errors
 
 
 def _parse_returns_section(sections: dict[str, str], *, validate_types: bool) -> dict[str, str] | str:
@@ -451,10 +504,8 @@ def _parse_returns_section(sections: dict[str, str], *, validate_types: bool) ->
             - The string 'None' if the section only contains 'None'
             - An empty dict if no return information is found
     """
-    if (
-        "Returns" not in sections
-        or not (returns_lines := sections["Returns"].split("\n"))
-        or not (return_match := re.match(r"^(?:([^:]+):\s*)?(.*)$", returns_lines[0].strip()))
+    if "Returns" not in sections or not (
+        return_match := RETURNS_LINE_PATTERN.match(sections["Returns"].partition("\n")[0].strip())
     ):
         return {}
 
@@ -481,7 +532,7 @@ def _process_returns_with_validation(
     result: dict[str, Any],
     validate_types: bool,
     collect_errors: bool,
-) -> None:
+) -> list[str]:
     """Process the Returns section with type validation.
 
     Args:
@@ -489,20 +540,25 @@ def _process_returns_with_validation(
         result (dict[str, Any]): The result dictionary to update
         validate_types (bool): Whether to validate type annotations
         collect_errors (bool): Whether to collect errors or raise them
+
+    Returns:
+        list[str]: Validation errors collected when collect_errors is True
     """
+    errors: list[str] = []
     if "Returns" not in sections:
-        return
+        return errors
 
     try:
         returns = _parse_returns_section(sections, validate_types=validate_types)
         if isinstance(returns, dict) and returns.get("type") and validate_types:
-            _validate_type_with_error_handling(returns["type"], result, collect_errors)
+            _validate_type_with_error_handling(returns["type"], errors, collect_errors)
         result["Returns"] = returns
     except InvalidTypeAnnotationError as e:
         if collect_errors:
-            result["errors"].append(str(e))
+            errors.append(str(e))
         else:
             raise
+    return errors
 
 
 def _process_references_section(sections: dict[str, str], result: dict[str, Any]) -> None:
@@ -551,13 +607,6 @@ def parse_google_docstring(
     if not docstring:
         return {}
 
-    # Initialize result dictionary with description and errors if needed
-    result: dict[str, Any] = {
-        "Description": "",
-    }
-    if collect_errors:
-        result["errors"] = []
-
     # Clean up the docstring
     docstring = docstring.strip()
 
@@ -565,30 +614,27 @@ def parse_google_docstring(
     sections = _extract_sections(docstring)
     parsed = parse(docstring)
 
-    # Process description
-    if parsed.description:
-        result["Description"] = parsed.description.rstrip()
+    # Only keys for sections that are present are added to the result
+    result: dict[str, Any] = {
+        "Description": parsed.description.rstrip() if parsed.description else "",
+    }
 
     # Process args with validation
-    _process_args_with_validation(sections, parsed, result, validate_types, collect_errors)
+    errors = _process_args_with_validation(sections, parsed, result, validate_types, collect_errors)
 
     # Process returns with validation
-    _process_returns_with_validation(sections, result, validate_types, collect_errors)
+    errors.extend(_process_returns_with_validation(sections, result, validate_types, collect_errors))
 
     # Process references section
     _process_references_section(sections, result)
 
-    # Add other sections directly using dict union
-    result.update(
-        {
-            section: content.rstrip()
-            for section, content in sections.items()
-            if section not in ["Description", "Args", "Returns"]
-        },
-    )
-
-    # Remove errors key if no errors
-    if collect_errors and not result["errors"]:
-        del result["errors"]
+    # Add other sections directly
+    for section, content in sections.items():
+        if section not in _STRUCTURED_SECTIONS:
+            result[section] = content.rstrip()
+
+    # Errors are only collected (never raised) when collect_errors is True
+    if errors:
+        result["errors"] = errors
 
     return result
@@ -18,9 +18,8 @@ This module contains functions and classes for validating type annotations in do
 
 from __future__ import annotations
 
+import functools
 import re
-from re import Match
-from typing import AnyStr
 
 # Generic collections that require type arguments - exactly as they should appear
 COLLECTIONS_REQUIRING_ARGS = (
@@ -72,8 +71,19 @@ COLLECTIONS_REQUIRING_ARGS = (
     "typing.Literal",
 )
 
+# Common types that never need further validation
+PRIMITIVE_TYPES = frozenset(("int", "str", "float", "bool", "bytes", "None", "Any", "object"))
+
 # Precompiled regex patterns
 COLLECTION_TYPE_PATTERN = re.compile(r"([A-Za-z0-9_]+)\[(.*)\]")
+TYPE_DECLARATION_PATTERN = re.compile(r"\(\s*([^)]+)\s*\):")  # Docstring parameter type declarations
+RETURN_DECLARATION_PATTERN = re.compile(r"^([A-Za-z0-9_\[\],\s]+):", re.MULTILINE)  # Return type declarations
+
+# Bare collections not followed by an opening bracket, only where they appear to be a type
+# (after a parenthesis or whitespace, before a colon or closing parenthesis)
+BARE_COLLECTION_PATTERNS = tuple(
+    (collection, re.compile(rf"(\(|\s){collection}\s*(?![\[\(\{{])[:\)]")) for collection in COLLECTIONS_REQUIRING_ARGS
+)
 
 # Special characters for bracket handling
 OPEN_BRACKET = "["
@@ -83,6 +93,10 @@ CLOSE_PAREN = ")"
 OPEN_BRACE = "{"
 CLOSE_BRACE = "}"
 
+# Characters that are emitted as separate tokens, and characters that open string literals
+SPECIAL_CHARS = "[](){},"
+QUOTE_CHARS = "\"'"
+
 # Constants for validation
 MAX_WORD_COUNT_FOR_TYPE = 3
 NESTING_KEYWORD = "with"
@@ -160,9 +174,25 @@ def is_bare_collection(type_name: str) -> bool:
     return is_collection_type(type_name) and "[" not in type_name
 
 
+def _is_simple_type_name(type_name: str) -> bool:
+    """Check if a type name is a plain, optionally dotted, identifier.
+
+    Args:
+        type_name (str): The type name to check.
+
+    Returns:
+        bool: True if the type name consists only of identifiers separated by dots, False otherwise
+    """
+    return all(part.isidentifier() for part in type_name.split("."))
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_type_annotation(type_annotation: str) -> None:
     """Validate a type annotation for proper syntax and collection usage.
 
+    Results are cached per annotation string, so annotations repeated across docstrings are only
+    validated once. Invalid annotations are not cached and raise on every call.
+
     Args:
         type_annotation (str): The type annotation to validate.
 
@@ -172,7 +202,7 @@ def validate_type_annotation(type_annotation: str) -> None:
     Raises:
         InvalidTypeAnnotationError: If the type annotation is invalid.
     """
-    if not type_annotation:
+    if not type_annotation or type_annotation in PRIMITIVE_TYPES:
         return
 
     # Check for bare collection types without arguments - exact match only
@@ -180,15 +210,21 @@ def validate_type_annotation(type_annotation: str) -> None:
         error_msg = f"Collection '{type_annotation}' must include element types (e.g., {type_annotation}[str])"
         raise InvalidTypeAnnotationError(error_msg)
 
+    # Plain names like 'CustomType' or 'module.CustomType' have no brackets to validate
+    if _is_simple_type_name(type_annotation):
+        return
+
     # Check for nested types in complex type annotations
     _validate_type_declaration(type_annotation)
 
 
+@functools.lru_cache(maxsize=4096)
 def check_text_for_bare_collections(text: str) -> None:
     """Check text for bare collection types that require brackets with arguments.
 
     This function examines a section of text, looking for collection types that
     are used without proper type arguments in brackets (e.g., 'List' without '[int]').
+    Text that passes is memoized, since the same nested types recur across docstrings.
 
     Args:
         text (str): The text to check for bare collection types.
@@ -201,11 +237,8 @@ def check_text_for_bare_collections(text: str) -> None:
             without proper bracket notation.
     """
     # Extract type declarations from the text first
-    type_pattern = r"\(\s*([^)]+)\s*\):"  # Match docstring parameter type declarations
-    return_pattern = r"^([A-Za-z0-9_\[\],\s]+):"  # Match return type declarations
-
-    type_matches = re.findall(type_pattern, text)
-    return_matches = re.findall(return_pattern, text, re.MULTILINE)
+    type_matches = TYPE_DECLARATION_PATTERN.findall(text)
+    return_matches = RETURN_DECLARATION_PATTERN.findall(text)
 
     # For each extracted type, validate it
     for type_decl in type_matches + return_matches:
@@ -223,13 +256,8 @@ def check_text_for_bare_collections(text: str) -> None:
                 raise
 
     # Next handle bare collections in the text (not in proper parentheses)
-    for collection in COLLECTIONS_REQUIRING_ARGS:
-        # Pattern to match bare collection not followed by opening bracket
-        # Only match when it appears to be a type (near parentheses or colons)
-        pattern = rf"(\(|\s){collection}\s*(?![\[\(\{{])[:\)]"
-        matches = list(re.finditer(pattern, text))
-
-        for match in matches:
+    for collection, pattern in BARE_COLLECTION_PATTERNS:
+        for match in pattern.finditer(text):
             # Skip if within string literals
             if _is_within_string_literal(text, match.start()):
                 continue
@@ -276,105 +304,80 @@ def _looks_like_type_annotation(text: str) -> bool:
     return False
 
 
-def _process_string_literals(text: str) -> tuple[str, list[str]]:
-    """Process string literals in text.
+def _find_closing_quote(text: str, start: int) -> int:
+    """Find the quote that closes a string literal opened at a given position.
 
     Args:
-        text (str): The text to process
+        text (str): The text to search in
+        start (int): Index of the opening quote character
 
     Returns:
-        tuple[str, list[str]]: A tuple containing:
-            - The processed text with literals replaced by placeholders
-            - List of extracted string literals
+        int: The index of the closing quote, or -1 if the literal is not terminated
     """
-    # Extract string literals to avoid false positives in brackets
-    pattern = r'(?:"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')'
-    matches = list(re.finditer(pattern, text))
-    result = text
-    extracted: list[str] = []
-
-    # Replace each match with a placeholder
-    for i, match in enumerate(reversed(matches)):
-        placeholder = f"STR_LITERAL_{len(matches) - i - 1}"
-        start, end = match.span()
-        extracted.insert(0, text[start:end])
-        result = result[:start] + placeholder + result[end:]
-
-    return result, extracted
-
+    quote = text[start]
+    i = start + 1
+    length = len(text)
+
+    while i < length:
+        char = text[i]
+        # Skip escaped characters (e.g. \" inside a double-quoted literal)
+        if char == "\\" and i + 1 < length and text[i + 1] != "\n":
+            i += 2
+            continue
+        if char == quote:
+            return i
+        i += 1
 
-def replace_string_literals(match: Match[AnyStr], literals: list[str]) -> str:
-    """Replace string literal placeholders with actual literals.
-
-    Args:
-        match (Match[AnyStr]): The regex match object
-        literals (list[str]): List of string literals
-
-    Returns:
-        str: The text with placeholders replaced by actual literals
-    """
-    placeholder = str(match.group(0))
-    if placeholder.startswith("STR_LITERAL_"):
-        idx = int(placeholder.split("_")[-1])
-        if idx < len(literals):
-            return literals[idx]
-    return placeholder
+    return -1
 
 
 def _tokenize_type_declaration(declaration: str) -> list[str]:
     """Tokenize a type declaration into individual components.
 
+    The declaration is scanned once from left to right. String literals are consumed as part of
+    the current token, so brackets and commas inside them are not treated as separators.
+
     Args:
         declaration (str): The type declaration to tokenize
 
     Returns:
         list[str]: List of tokens from the type declaration
     """
-    # Process string literals to avoid treating brackets in strings as real brackets
-    processed_text, string_literals = _process_string_literals(declaration)
-
-    # Initialize empty list for tokens
     tokens: list[str] = []
 
-    # Define special characters
-    special_chars = "[](){},"
+    # Start index of the token currently being scanned, None if between tokens
+    token_start: int | None = None
 
-    # Process the text character by character
     i = 0
-    current_token = ""
+    length = len(declaration)
 
-    while i < len(processed_text):
-        char = processed_text[i]
+    while i < length:
+        char = declaration[i]
 
-        # Handle special characters (brackets and comma)
-        if char in special_chars:
-            # If we have a current token, add it to the list
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
+        # Consume string literals in one step
+        if char in QUOTE_CHARS and (closing := _find_closing_quote(declaration, i)) != -1:
+            if token_start is None:
+                token_start = i
+            i = closing + 1
+            continue
+
+        # Special characters (brackets and comma) and whitespace end the current token
+        if char in SPECIAL_CHARS or char.isspace():
+            if token_start is not None:
+                tokens.append(declaration[token_start:i])
+                token_start = None
             # Add the special character as its own token
-            tokens.append(char)
-        # Handle whitespace as a token separator
-        elif char.isspace():
-            # If we have a current token, add it to the list
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-        # Handle regular characters as part of a token
-        else:
-            current_token += char
+            if char in SPECIAL_CHARS:
+                tokens.append(char)
+        # Regular characters start a new token if needed
+        elif token_start is None:
+            token_start = i
 
         i += 1
 
     # Add the last token if there is one
-    if current_token:
-        tokens.append(current_token)
-
-    # Restore string literals in the tokens
-    pattern = r"STR_LITERAL_\d+"
-    for i, token in enumerate(tokens):
-        if re.match(pattern, token):
-            tokens[i] = re.sub(pattern, lambda m: replace_string_literals(m, string_literals), token)
+    if token_start is not None:
+        tokens.append(declaration[token_start:])
 
     return tokens
 
@@ -7,30 +7,11 @@ import pytest
 from google_docstring_parser.type_validation import (
     BracketValidationError,
     InvalidTypeAnnotationError,
-    _process_string_literals,
     _tokenize_type_declaration,
     _validate_type_declaration,
 )
 
 
-def test_process_string_literals() -> None:
-    """Test that string literals are properly processed and placeholders are returned."""
-    # Test with various string literals
-    test_input = 'Type[Literal["list", "tuple"]] and "Dict"'
-    result, extracted = _process_string_literals(test_input)
-
-    # Check that string literals were extracted
-    assert len(extracted) == 3
-    assert extracted[0] == '"list"'
-    assert extracted[1] == '"tuple"'
-    assert extracted[2] == '"Dict"'
-
-    # Check that placeholders were inserted
-    assert "STR_LITERAL_0" in result
-    assert "STR_LITERAL_1" in result
-    assert "STR_LITERAL_2" in result
-
-
 def test_tokenize_type_declaration() -> None:
     """Test that type declarations are properly tokenized."""
     # Test with various type declarations
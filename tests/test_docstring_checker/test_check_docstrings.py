@@ -1,9 +1,11 @@
 """Tests for the docstring checker tool."""
+from __future__ import annotations
 
 import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -545,3 +547,99 @@ paths = []
 
     # Check that it shows the empty paths in the configuration output
     assert "Paths: []" in result.stdout, "Should show empty paths list in configuration"
+
+
+@pytest.mark.parametrize(
+    "content,expected_config",
+    [
+        ('[tool.docstring_checker]\npaths = ["src"]\n', {"paths": ["src"]}),
+        (
+            '[tool.ruff]\nline-length = 120\n\n[tool.docstring_checker]\nverbose = true\n\n[tool.mypy]\nstrict = true\n',
+            {"verbose": True},
+        ),
+        # Dotted keys instead of a table header
+        ('[tool]\ndocstring_checker.paths = ["src"]\n', {"paths": ["src"]}),
+        # An array line starting with "[" cuts the slice short, so the whole file is parsed
+        ('[tool.docstring_checker]\npaths = [\n["src"]\n]\n', {"paths": [["src"]]}),
+        ('[tool.ruff]\nline-length = 120\n', {}),
+    ],
+)
+def test_read_tool_config(content: str, expected_config: dict[str, Any]) -> None:
+    """Test reading the checker's table with and without locating its header.
+
+    Args:
+        content (str): pyproject.toml content
+        expected_config (dict[str, Any]): Expected [tool.docstring_checker] table
+    """
+    from tools.check_docstrings import _read_tool_config
+
+    tomllib = pytest.importorskip("tomllib" if sys.version_info >= (3, 11) else "tomli")
+    assert _read_tool_config(content.encode(), tomllib.loads) == expected_config
+
+
+def test_load_pyproject_config_picks_up_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the cached configuration is reloaded when pyproject.toml is modified.
+
+    Args:
+        tmp_path (Path): Temporary directory fixture
+        monkeypatch (pytest.MonkeyPatch): Fixture used to change the working directory
+    """
+    from tools.check_docstrings import load_pyproject_config
+
+    monkeypatch.chdir(tmp_path)
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.docstring_checker]\njobs = 2\n")
+    assert load_pyproject_config()["jobs"] == 2
+    assert load_pyproject_config() is load_pyproject_config()
+
+    pyproject.write_text("[tool.docstring_checker]\njobs = 3\n")
+    os.utime(pyproject, ns=(0, pyproject.stat().st_mtime_ns + 1))
+    assert load_pyproject_config()["jobs"] == 3
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "env_cache_dir", "expected_cache_dir"),
+    [
+        # The cache is opt-in
+        ([], None, None),
+        (["--cache"], None, ".docstring_checker_cache"),
+        (["--cache-dir", "custom_cache"], None, "custom_cache"),
+        ([], "env_cache", "env_cache"),
+        (["--cache", "--no-cache"], "env_cache", None),
+    ],
+)
+def test_cache_is_opt_in(
+    tmp_path: Path,
+    extra_args: list[str],
+    env_cache_dir: str | None,
+    expected_cache_dir: str | None,
+) -> None:
+    """Test that docstrings are only cached when caching is explicitly enabled.
+
+    Args:
+        tmp_path (Path): Temporary directory fixture
+        extra_args (list[str]): Extra command line arguments
+        env_cache_dir (str | None): Value of the DOCSTRING_CACHE_DIR environment variable
+        expected_cache_dir (str | None): Cache directory expected to be created, None for no cache
+    """
+    (tmp_path / "module.py").write_text('def first():\n    """First function."""\n')
+
+    project_root = Path(__file__).parent.parent.parent
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_root)
+    env.pop("DOCSTRING_CACHE_DIR", None)
+    if env_cache_dir is not None:
+        env["DOCSTRING_CACHE_DIR"] = env_cache_dir
+
+    result = subprocess.run(
+        [sys.executable, str(project_root / "tools" / "check_docstrings.py"), "module.py", *extra_args],
+        cwd=str(tmp_path),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    cache_dirs = sorted(path.name for path in tmp_path.iterdir() if path.is_dir())
+    assert cache_dirs == ([expected_cache_dir] if expected_cache_dir else [])
@@ -1,16 +1,22 @@
 """Tests for the docstring validation functions."""
 from __future__ import annotations
 
+import ast
+import os
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from tools import check_docstrings
 from tools.check_docstrings import (
+    _get_docstring,
     validate_docstring,
     check_param_types,
     get_docstrings,
     check_returns_type,
+    check_returns_section_name,
+    check_references,
 )
 from google_docstring_parser.google_docstring_parser import parse_google_docstring
 
@@ -66,6 +72,31 @@ from google_docstring_parser.google_docstring_parser import parse_google_docstri
                 "Unclosed parenthesis in parameter type: 'param1 (dict[str, list[int): Unclosed bracket'",
             ],
         ),
+        # Invalid type declaration
+        (
+            """A docstring with an invalid type.
+
+            Args:
+                param1 (invalid type): Parameter with an invalid type
+            """,
+            ["Invalid type declaration: 'param1 (invalid type): Parameter with an invalid type'"],
+        ),
+        # Unclosed bracket and invalid type on the same line
+        (
+            "A docstring.\n\n    param1 (invalid type): see [note",
+            [
+                "Unclosed parenthesis in parameter type: 'param1 (invalid type): see [note'",
+                "Invalid type declaration: 'param1 (invalid type): see [note'",
+            ],
+        ),
+        # Parenthesis on a later line does not belong to the definition
+        ("A docstring.\n\n    param1\n    (int", []),
+        # Many brackets on one line are matched in linear time
+        ("A docstring.\n\n    param1 (list): " + "[" * 20000 + "]", []),
+        (
+            "A docstring.\n\n    param1 (list): " + "[]" * 10000 + "[",
+            ["Unclosed parenthesis in parameter type: 'param1 (list): " + "[]" * 10000 + "['"],
+        ),
     ],
 )
 def test_validate_docstring(docstring: str, expected_errors: list[str]) -> None:
@@ -136,6 +167,199 @@ def test_check_param_types(docstring_dict: dict[str, Any], require_types: bool,
     assert errors == expected_errors
 
 
+def test_get_docstrings_cache(tmp_path: Path) -> None:
+    """Test that get_docstrings reuses cached docstrings until the file changes."""
+    source_file = tmp_path / "module.py"
+    source_file.write_text('def first():\n    """First function."""\n')
+    cache_dir = tmp_path / "cache"
+
+    uncached = get_docstrings(source_file)
+    assert get_docstrings(source_file, cache_dir) == uncached
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # A cache hit returns the same docstrings
+    assert get_docstrings(source_file, cache_dir) == [("first", 1, "First function.")]
+
+    # Changing the file invalidates the cached entry
+    source_file.write_text('def second():\n    """Second function with a longer docstring."""\n')
+    assert get_docstrings(source_file, cache_dir) == [("second", 1, "Second function with a longer docstring.")]
+
+
+def test_get_docstrings_cache_matches_content_after_touch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a file with a new modification time but unchanged content is not parsed again."""
+    source_file = tmp_path / "module.py"
+    source_file.write_text('def first():\n    """First function."""\n')
+    cache_dir = tmp_path / "cache"
+    expected = get_docstrings(source_file, cache_dir)
+
+    # Simulate a fresh checkout: same content, different modification time
+    os.utime(source_file, ns=(0, source_file.stat().st_mtime_ns + 1_000_000_000))
+
+    def fail_to_parse(file_path: Path, content: bytes) -> ast.Module | None:
+        raise AssertionError(f"{file_path} should not be parsed again")
+
+    monkeypatch.setattr(check_docstrings, "_parse_source", fail_to_parse)
+    assert get_docstrings(source_file, cache_dir) == expected
+    # The refreshed stamp makes the next lookup a plain cache hit
+    assert get_docstrings(source_file, cache_dir) == expected
+
+
+def test_get_docstrings_cache_skips_syntax_errors(tmp_path: Path) -> None:
+    """Test that files with syntax errors are not cached."""
+    source_file = tmp_path / "broken.py"
+    source_file.write_text('def broken(:\n    """Broken."""\n')
+    cache_dir = tmp_path / "cache"
+
+    assert get_docstrings(source_file, cache_dir) == []
+    assert not list(cache_dir.glob("*.json"))
+
+
+def test_check_file_reports_undecodable_files(tmp_path: Path) -> None:
+    """Test that a file that is not valid UTF-8 is reported as an error, not skipped as a syntax error."""
+    source_file = tmp_path / "module.py"
+    source_file.write_bytes(b'def f():\n    """Caf\xe9."""\n')
+
+    errors = check_docstrings.check_file(source_file)
+    assert len(errors) == 1
+    assert "Error getting docstrings" in errors[0]
+
+    # The same bytes are valid with an encoding cookie
+    source_file.write_bytes(b'# -*- coding: latin-1 -*-\ndef f():\n    """Caf\xe9."""\n')
+    assert get_docstrings(source_file) == [("f", 2, "Caf\xe9.")]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # No definitions, so the file cannot contain docstrings
+        b'NAME = "Caf\xe9"\n',
+        # No string literals
+        b"def f():\n    pass  # Caf\xe9\n",
+    ],
+)
+def test_check_file_reports_undecodable_files_without_docstrings(tmp_path: Path, content: bytes) -> None:
+    """Test that undecodable files are reported even if they cannot contain docstrings."""
+    source_file = tmp_path / "module.py"
+    source_file.write_bytes(content)
+
+    errors = check_docstrings.check_file(source_file)
+    assert len(errors) == 1
+    assert "Error getting docstrings" in errors[0]
+
+
+def test_check_file_keeps_param_type_errors_when_references_fail(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a failing reference check does not discard the parameter type errors."""
+    source_file = tmp_path / "module.py"
+    source_file.write_text('def f(x):\n    """Do something.\n\n    Args:\n        x: The value\n    """\n')
+
+    def fail_to_check(parsed: dict[str, Any]) -> list[str]:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(check_docstrings, "check_references", fail_to_check)
+    errors = check_docstrings.check_file(source_file, require_param_types=True)
+
+    assert len(errors) == 2
+    assert "Parameter 'x' is missing a type" in errors[0]
+    assert "Error checking references: boom" in errors[1]
+
+
+@pytest.mark.parametrize(
+    "cache_content",
+    [
+        "",
+        "not json",
+        "[]",
+        '{"stamp": [], "digest": "", "docstrings": [["first", "1", "First function."]]}',
+        '{"stamp": "stamp", "digest": "", "docstrings": []}',
+        '{"stamp": [], "digest": null, "docstrings": []}',
+    ],
+)
+def test_get_docstrings_cache_ignores_malformed_entries(tmp_path: Path, cache_content: str) -> None:
+    """Test that a malformed cache file is treated as a cache miss and replaced."""
+    source_file = tmp_path / "module.py"
+    source_file.write_text('def first():\n    """First function."""\n')
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache_file = check_docstrings._get_cache_file(cache_dir, source_file)
+    cache_file.write_text(cache_content)
+
+    assert get_docstrings(source_file, cache_dir) == [("first", 1, "First function.")]
+    assert check_docstrings._load_cache_entry(cache_file) is not None
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        # Empty file
+        (b"", []),
+        # No definitions, so the file is not parsed
+        (b'__all__ = ["a", "b"]\n', []),
+        # Single-quoted docstrings are still found
+        (b"def f():\n    'Docstring.'\n", [("f", 1, "Docstring.")]),
+        # Encoding declared with a PEP 263 cookie
+        (
+            '# -*- coding: latin-1 -*-\ndef caf\u00e9():\n    """Caf\u00e9 function."""\n'.encode("latin-1"),
+            [("caf\u00e9", 2, "Caf\u00e9 function.")],
+        ),
+    ],
+)
+def test_get_docstrings_reads_bytes(tmp_path: Path, content: bytes, expected: list[tuple[str, int, str]]) -> None:
+    """Test that get_docstrings handles empty files and encoding cookies."""
+    source_file = tmp_path / "module.py"
+    source_file.write_bytes(content)
+
+    docstrings = get_docstrings(source_file)
+    assert docstrings == expected
+
+
+def test_get_docstrings_finds_nested_definitions_in_source_order(tmp_path: Path) -> None:
+    """Test that get_docstrings finds definitions inside compound statements, in source order."""
+    source_file = tmp_path / "module.py"
+    source_file.write_text(
+        '''
+try:
+    def in_try():
+        """In try."""
+except ImportError:
+    def in_except():
+        """In except."""
+else:
+    def in_else():
+        """In else."""
+finally:
+    def in_finally():
+        """In finally."""
+
+class Outer:
+    """Outer class."""
+
+    def method(self, flag=lambda: None):
+        """Method."""
+        if flag:
+            def in_if():
+                """In if."""
+        else:
+            def in_else_branch():
+                """In else branch."""
+''',
+    )
+
+    names = [name for name, _, _ in get_docstrings(source_file)]
+    assert names == [
+        "in_try",
+        "in_except",
+        "in_else",
+        "in_finally",
+        "Outer",
+        "method",
+        "in_if",
+        "in_else_branch",
+    ]
+
+
 def test_get_docstrings() -> None:
     """Test the get_docstrings function with the test files."""
     # Test with valid docstrings file
@@ -143,7 +367,7 @@ def test_get_docstrings() -> None:
     docstrings = get_docstrings(valid_file)
 
     # Check that we found the class and function docstrings
-    function_names = [name for name, _, _, _ in docstrings]
+    function_names = [name for name, _, _ in docstrings]
     assert "simple_function" in function_names
     assert "function_with_args" in function_names
     assert "function_with_sections" in function_names
@@ -154,7 +378,7 @@ def test_get_docstrings() -> None:
     docstrings = get_docstrings(malformed_file)
 
     # Check that we found the function docstrings with issues
-    function_names = [name for name, _, _, _ in docstrings]
+    function_names = [name for name, _, _ in docstrings]
     assert "missing_arg_type" in function_names
     assert "malformed_section" in function_names
     assert "unclosed_parenthesis" in function_names
@@ -276,3 +500,95 @@ def test_check_returns_type(docstring_dict: dict[str, Any], expected_errors: lis
     """Test the check_returns_type function with various docstring dictionaries."""
     errors = check_returns_type(docstring_dict)
     assert errors == expected_errors
+
+
+@pytest.mark.parametrize(
+    "docstring,expected_errors",
+    [
+        # Correct section name
+        (
+            """A docstring.
+
+            Returns:
+                bool: True if successful
+            """,
+            [],
+        ),
+        # No Returns section
+        ("""A docstring without returns.""", []),
+        # Section name mentioned inside a sentence is not a header
+        ("""Calls helper and the return: value is ignored.""", []),
+        # Misspelled section names
+        (
+            """A docstring.
+
+            return:
+                bool: True if successful
+
+            Return:
+                bool: True if successful
+
+            returns:
+                bool: True if successful
+            """,
+            [
+                "Invalid section name 'return:', use 'Returns:' instead",
+                "Invalid section name 'Return:', use 'Returns:' instead",
+                "Invalid section name 'returns:', use 'Returns:' instead",
+            ],
+        ),
+        # Surrounding whitespace is ignored
+        ("A docstring.\n\n\treturns:  \n    bool: True", ["Invalid section name 'returns:', use 'Returns:' instead"]),
+    ],
+)
+def test_check_returns_section_name(docstring: str, expected_errors: list[str]) -> None:
+    """Test the check_returns_section_name function with various docstrings."""
+    errors = check_returns_section_name(docstring)
+    assert errors == expected_errors
+
+
+@pytest.mark.parametrize(
+    "docstring_dict,expected_errors",
+    [
+        # No References section
+        ({"Description": "A docstring without references"}, []),
+        # Valid references
+        ({"References": [{"description": "Paper", "source": "https://example.com"}]}, []),
+        # Singular section name
+        ({"Reference": [{"description": "Paper", "source": ""}]}, ["Reference #1 has an empty source"]),
+        # Section that is not a list
+        ({"References": "Paper: https://example.com"}, ["References section is not properly formatted"]),
+        ({"Reference": "Paper: https://example.com"}, ["Reference section is not properly formatted"]),
+        # Reference that is not a dict
+        ({"References": ["Paper"]}, ["Reference #1 is not properly formatted"]),
+        # Plural section takes precedence
+        (
+            {"References": [], "Reference": [{"description": "", "source": "https://example.com"}]},
+            [],
+        ),
+    ],
+)
+def test_check_references(docstring_dict: dict[str, Any], expected_errors: list[str]) -> None:
+    """Test the check_references function with various docstring dictionaries."""
+    errors = check_references(docstring_dict)
+    assert errors == expected_errors
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        'def f():\n    """One line."""\n',
+        'def f():\n    """   Leading and trailing spaces.   """\n',
+        'def f():\n    """Tab\there."""\n',
+        'def f():\n    """\n    Multiple\n\n        lines.\n    """\n',
+        'def f():\n    """   """\n',
+        'def f():\n    b"""Bytes."""\n',
+        'def f():\n    x = 1\n',
+        'class C:\n    """Class docstring."""\n',
+    ],
+)
+def test_get_docstring_matches_ast(source: str) -> None:
+    """Test that _get_docstring returns the same docstring as ast.get_docstring."""
+    node = ast.parse(source).body[0]
+    assert isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    assert _get_docstring(node) == ast.get_docstring(node)
@@ -2,10 +2,35 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
-from tools.check_docstrings import check_file, scan_directory
+from tools.check_docstrings import PARALLEL_MIN_FILES, CheckOptions, _process_paths, check_file, scan_directory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MALFORMED_FILE = Path(__file__).parent / "test_malformed_docstrings.py"
+
+
+@pytest.fixture
+def write_malformed(tmp_path: Path) -> Callable[..., None]:
+    """Return a function writing copies of the malformed docstrings file to the given paths under tmp_path."""
+    malformed_source = MALFORMED_FILE.read_text()
+
+    def write(*relative_paths: str) -> None:
+        for relative_path in relative_paths:
+            file_path = tmp_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(malformed_source)
+
+    return write
+
+
+def _checked_files(errors: list[str], root: Path) -> set[str]:
+    """Return the paths, relative to root, of the files that errors were reported for."""
+    return {Path(error.split(":")[0]).relative_to(root).as_posix() for error in errors}
 
 
 def test_valid_docstrings_file() -> None:
@@ -70,6 +95,138 @@ def test_scan_directory() -> None:
     assert len(errors_including_malformed) > len(errors_excluding_malformed)
 
 
+@pytest.mark.parametrize(
+    "exclude_files,expected_files",
+    [
+        ([], {"a/module.py", "b/module.py", "b/other.py"}),
+        (["module.py"], {"b/other.py"}),
+        (["a/module.py"], {"b/module.py", "b/other.py"}),
+        (["b/module.py", "other.py"], {"a/module.py"}),
+        (["mod*.py"], {"b/other.py"}),
+        (["b/*.py"], {"a/module.py"}),
+        (["?/module.py", "[ab]/other.py"], set()),
+        (["x*.py", "oth*.py", "a/*.py"], {"b/module.py"}),
+    ],
+)
+def test_scan_directory_exclude_files(
+    tmp_path: Path,
+    write_malformed: Callable[..., None],
+    exclude_files: list[str],
+    expected_files: set[str],
+) -> None:
+    """Test excluding files by filename and by path suffix, with and without wildcards."""
+    write_malformed("a/module.py", "b/module.py", "b/other.py")
+
+    errors = scan_directory(tmp_path, exclude_files=exclude_files)
+
+    assert _checked_files(errors, tmp_path) == expected_files
+
+
+@pytest.mark.parametrize(
+    ("exclude_dirs", "expected_files"),
+    [
+        # Build output is skipped by default
+        (None, {"src/module.py"}),
+        # An empty list scans build output too, hidden and cache directories are always skipped
+        ([], {"src/module.py", "build/module.py"}),
+        (["src"], {"build/module.py"}),
+    ],
+)
+def test_scan_directory_skips_pruned_directories(
+    tmp_path: Path,
+    write_malformed: Callable[..., None],
+    exclude_dirs: list[str] | None,
+    expected_files: set[str],
+) -> None:
+    """Test that hidden directories and caches are not scanned, and build output only by default."""
+    write_malformed("src/module.py", ".venv/lib/module.py", "src/__pycache__/module.py", "build/module.py")
+    # Directories whose names merely end in .py are not files to check
+    (tmp_path / "src" / "package.py").mkdir()
+
+    errors = scan_directory(tmp_path, exclude_dirs=exclude_dirs)
+
+    assert _checked_files(errors, tmp_path) == expected_files
+    # A directory passed explicitly is scanned even if its name is excluded
+    assert scan_directory(tmp_path / "build")
+
+
+def test_scan_directory_symlinks(tmp_path: Path, write_malformed: Callable[..., None]) -> None:
+    """Test that, as with Path.glob("**"), symlinked files are checked but symlinked directories are not followed."""
+    write_malformed("outside/module.py")
+    (tmp_path / "src").mkdir()
+    try:
+        (tmp_path / "src" / "linked_dir").symlink_to(tmp_path / "outside", target_is_directory=True)
+        (tmp_path / "src" / "linked.py").symlink_to(tmp_path / "outside" / "module.py")
+    except OSError:
+        pytest.skip("Symlinks are not supported")
+
+    errors = scan_directory(tmp_path / "src")
+
+    checked_files = _checked_files(errors, tmp_path)
+    assert checked_files == {"src/linked.py"}
+    assert {path.relative_to(tmp_path).as_posix() for path in (tmp_path / "src").glob("**/*.py")} == checked_files
+
+
+def test_scan_directory_parallel_matches_sequential(tmp_path: Path, write_malformed: Callable[..., None]) -> None:
+    """Test that checking files in worker processes gives the same errors as checking them in-process."""
+    write_malformed(*(f"module_{i}.py" for i in range(PARALLEL_MIN_FILES)))
+
+    sequential_errors = scan_directory(tmp_path, require_param_types=True, jobs=1)
+    parallel_errors = scan_directory(tmp_path, require_param_types=True, jobs=2)
+
+    assert sequential_errors
+    assert parallel_errors == sequential_errors
+
+
+def test_scan_directory_accepts_positional_options(tmp_path: Path) -> None:
+    """Test that the options of scan_directory can still be passed positionally."""
+    (tmp_path / "module.py").write_text('def f(x):\n    """Do something.\n\n    Args:\n        x: The value\n    """\n')
+
+    errors = scan_directory(tmp_path, [], True, False, True)
+
+    assert errors
+    assert errors == scan_directory(tmp_path, require_param_types=True)
+    assert scan_directory(tmp_path, [], False) == []
+
+
+def test_syntax_errors_are_printed_by_the_parent_process(tmp_path: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    """Test that syntax errors found in worker processes are printed once, in file order, by the parent."""
+    for i in range(PARALLEL_MIN_FILES):
+        (tmp_path / f"module_{i}.py").write_text('def broken(:\n    """Broken."""\n')
+
+    errors = _process_paths([str(tmp_path)], [], CheckOptions(jobs=2), verbose=True)
+
+    assert errors == []
+    lines = capfd.readouterr().out.splitlines()
+    expected: list[str] = []
+    for i in range(PARALLEL_MIN_FILES):
+        file_path = tmp_path / f"module_{i}.py"
+        expected.extend((f"Checking {file_path}", f"Syntax error in {file_path}"))
+    assert [line.split(":")[0] for line in lines] == expected
+
+
+def test_process_paths_checks_files_and_directories_together(
+    tmp_path: Path,
+    write_malformed: Callable[..., None],
+) -> None:
+    """Test that files passed individually are checked alongside directories, in path order."""
+    write_malformed("single.py", *(f"package/module_{i}.py" for i in range(PARALLEL_MIN_FILES)))
+    package = tmp_path / "package"
+    single_file = tmp_path / "single.py"
+
+    paths = [str(single_file), str(package)]
+    sequential_errors = _process_paths(paths, [], CheckOptions(require_param_types=True, jobs=1))
+    parallel_errors = _process_paths(paths, [], CheckOptions(require_param_types=True, jobs=2))
+
+    assert sequential_errors[0].startswith(str(single_file))
+    assert parallel_errors == sequential_errors
+    assert sequential_errors == check_file(single_file, require_param_types=True) + scan_directory(
+        package,
+        require_param_types=True,
+        jobs=1,
+    )
+
+
 @pytest.mark.parametrize(
     "filename,require_types,expected_error_count",
     [
@@ -89,3 +246,19 @@ def test_parametrized_file_checks(filename: str, require_types: bool, expected_e
         f"Expected at least {expected_error_count} errors in {filename} "
         f"with require_types={require_types}, but found {len(errors)}"
     )
+
+
+def test_process_paths_checks_overlapping_paths_once(
+    tmp_path: Path,
+    write_malformed: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that files reachable through several of the given paths are checked once."""
+    write_malformed("src/module.py", "src/sub/module.py")
+    monkeypatch.chdir(tmp_path)
+
+    expected_errors = _process_paths(["src"], [], CheckOptions())
+    errors = _process_paths(["src", "./src/sub", "src/module.py", str(tmp_path / "src")], [], CheckOptions())
+
+    assert expected_errors
+    assert errors == expected_errors
@@ -1,7 +1,11 @@
+from __future__ import annotations
+
+import json
+
 import pytest
 
 from google_docstring_parser import parse_google_docstring
-from google_docstring_parser.google_docstring_parser import ReferenceFormatError
+from google_docstring_parser.google_docstring_parser import ReferenceErrorCode, ReferenceFormatError
 
 
 def test_parse_references_multiple_with_dash() -> None:
@@ -401,3 +405,56 @@ def test_parse_references_mixed_formatting() -> None:
 
     assert references[2]['description'] == 'Another simple one'
     assert references[2]['source'] == 'Just a short note.'
+
+
+@pytest.mark.parametrize(
+    "code,line,expected_message",
+    [
+        ("missing_dash", "", "Multiple references must all start with dash (-)"),
+        ("dash_in_single", "", "Single reference should not start with dash (-)"),
+        ("missing_colon", "Docs", "Invalid reference format, missing colon separator: Docs"),
+        ("empty_description", ": url", "Invalid reference format, empty description: : url"),
+        ("unknown_code", "", "Reference Format Error"),
+    ],
+)
+def test_reference_format_error_message(code: str, line: str, expected_message: str) -> None:
+    """Test that the error message is built from the error code and line."""
+    error = ReferenceFormatError(code, line)
+
+    assert error.code == code
+    assert str(error) == expected_message
+
+
+@pytest.mark.parametrize(
+    "code,expected_code",
+    [
+        ("missing_dash", ReferenceErrorCode.MISSING_DASH),
+        ("dash_in_single", ReferenceErrorCode.DASH_IN_SINGLE),
+        (ReferenceErrorCode.MISSING_COLON, ReferenceErrorCode.MISSING_COLON),
+        (ReferenceErrorCode.EMPTY_DESCRIPTION, ReferenceErrorCode.EMPTY_DESCRIPTION),
+    ],
+)
+def test_reference_error_code_compatibility(code: ReferenceErrorCode | str, expected_code: ReferenceErrorCode) -> None:
+    """Test that error codes accept and compare equal to the legacy string codes."""
+    error = ReferenceFormatError(code)
+
+    legacy_code = expected_code.name.lower()
+    assert error.code is expected_code
+    assert error.code == legacy_code
+    assert not error.code != legacy_code  # noqa: SIM202
+    assert error.code != "some_other_code"
+    assert {legacy_code: True}.get(error.code)
+    assert json.dumps(error.code) == f'"{legacy_code}"'
+    assert str(error.code) == legacy_code
+    assert f"{error.code}" == legacy_code
+    assert f"{error.code:>20}" == f"{legacy_code:>20}"
+    assert "%s" % error.code == legacy_code  # noqa: UP031
+    assert error.args == (str(error),)
+
+
+def test_reference_format_error_unhashable_code() -> None:
+    """Test that an unhashable error code gives the generic message instead of a TypeError."""
+    error = ReferenceFormatError(["missing_dash"])  # type: ignore[arg-type]
+
+    assert error.code == ["missing_dash"]
+    assert str(error) == "Reference Format Error"
@@ -38,6 +38,8 @@ from google_docstring_parser.type_validation import (
         ("Type[int]", False),
         ("CustomType", False),
         ("module.CustomType", False),
+        ("bytes", False),
+        ("object", False),
         ('Literal["option1", "option2"]', False),
         ('Literal[1, 2, 3]', False),
         ('Literal["success", True, None]', False),
@@ -59,6 +61,8 @@ from google_docstring_parser.type_validation import (
         ("Sequence", True),
         ("Literal", True),
         ("literal", True),
+        ("typing.List", True),
+        ("typing.dict", True),
     ],
 )
 def test_validate_type_annotation(type_name: str, should_raise: bool) -> None:
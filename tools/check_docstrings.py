@@ -7,126 +7,512 @@ docstrings can be parsed with the google_docstring_parser.
 
 from __future__ import annotations
 
-import argparse
 import ast
+import fnmatch
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Any, NamedTuple
-
-import tomli
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from google_docstring_parser.google_docstring_parser import (
     parse_google_docstring,
 )
 
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
 # Default configuration
 DEFAULT_CONFIG = {
     "paths": [],  # Empty by default, so no directories are scanned unless explicitly specified
     "require_param_types": False,
     "check_references": True,
     "exclude_files": [],
+    "exclude_dirs": None,  # Directory names skipped when scanning, None uses DEFAULT_EXCLUDE_DIRS
     "verbose": False,
+    "jobs": None,  # Number of worker processes, None uses the number of CPUs
+    "cache": False,  # Cache extracted docstrings between runs (opt-in)
+    "cache_dir": None,  # Directory for the cache, None uses DEFAULT_CACHE_DIR
 }
 
+# Keys read from [tool.docstring_checker] and the converter applied to each value, None keeps it as given
+CONFIG_CONVERTERS: tuple[tuple[str, Callable[[Any], Any] | None], ...] = (
+    ("paths", None),
+    ("require_param_types", bool),
+    ("check_references", bool),
+    ("exclude_files", None),
+    ("exclude_dirs", None),
+    ("verbose", bool),
+    ("jobs", int),
+    ("cache", bool),
+    ("cache_dir", str),
+)
+
+# Directory (relative to the working directory) where extracted docstrings are cached between runs
+DEFAULT_CACHE_DIR = ".docstring_checker_cache"
+
+# Environment variable that enables the cache and sets its directory, e.g. a directory restored in CI
+CACHE_DIR_ENV_VAR = "DOCSTRING_CACHE_DIR"
+
+# Bump when the format of cached docstrings or the way they are extracted changes
+CACHE_VERSION = 4
+
+# Directories with fewer Python files than this are checked in the current process,
+# since starting worker processes would cost more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Directories that never contain project sources, always skipped without descending into them when
+# scanning. Hidden directories (".git", ".venv", ".tox", tool caches, the checker's own cache) are skipped too.
+PRUNED_DIRECTORIES = frozenset(("__pycache__",))
+
+# Directory names skipped when scanning unless exclude_dirs is configured (build output, virtual environments)
+DEFAULT_EXCLUDE_DIRS = ("build", "dist", "node_modules", "venv")
+
+# Header of the checker's pyproject.toml table, and the start of the table that follows it.
+# Only the lines in between are parsed when the header is found.
+TOOL_TABLE_HEADER = b"[tool.docstring_checker]"
+TABLE_HEADER_START = b"\n["
+
+# Filename suffixes of the files to check, for a single str.endswith call
+PYTHON_FILE_SUFFIXES = (".py",)
+
+# Characters that make an exclude pattern a shell-style wildcard pattern
+GLOB_CHARS = frozenset("*?[")
+
+# AST nodes that carry docstrings
+DEFINITION_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Fields holding the nested statements (or except handlers / match cases) of a statement, in source order.
+# Definitions can only appear in these, so expressions are never visited.
+STATEMENT_LIST_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+# Line-level checks run in a single pass over the whole docstring. Each line is matched
+# (ignoring surrounding whitespace) as one of:
+#   - a misspelled Returns section header on a line of its own
+#   - a parameter definition with an unclosed parenthesis or bracket in its type
+#   - a parameter definition with an invalid type
+# Only the last "[" on a line can be unclosed, so it is matched atomically (a lookahead capture
+# followed by a backreference, as (?>...) needs Python 3.11); backtracking to earlier brackets
+# would make lines with many of them quadratic.
+DOCSTRING_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<returns>return:|Return:|returns:)[^\S\n]*$"
+    r"|(?P<unclosed>\w+[^\S\n]+\((?:[^)\n]*|(?=(?P<bracket>.*\[))(?P=bracket)[^\]\n]*)$)"
+    r"|(?P<invalid>\w+[^\S\n]+\(invalid type\))"
+    r")",
+    re.MULTILINE,
+)
+
+# Invalid type declarations, matched against a stripped line already reported as unclosed
+INVALID_TYPE_PATTERN = re.compile(r"(\w+)\s+\((invalid type)\)")
+
+
+class CheckOptions(NamedTuple):
+    """Options for checking the docstrings of a set of files.
+
+    Args:
+        require_param_types (bool): Whether parameter types are required
+        check_references (bool): Whether to check references for errors
+        jobs (int | None): Maximum number of worker processes, None to use the number of CPUs
+        cache_dir (Path | None): Directory to cache extracted docstrings in, None to disable caching
+
+    Returns:
+        CheckOptions: A named tuple containing the check options
+    """
+
+    require_param_types: bool = False
+    check_references: bool = True
+    jobs: int | None = None
+    cache_dir: Path | None = None
+
+
+class FileContext(NamedTuple):
+    """Context for processing the docstrings of a file.
 
-class DocstringContext(NamedTuple):
-    """Context for docstring processing.
+    Built once per file; the name and line number of each docstring are passed separately.
 
     Args:
         file_path (Path): Path to the file
-        line_no (int): Line number
-        name (str): Name of the function or class
-        verbose (bool): Whether to print verbose output
         require_param_types (bool): Whether parameter types are required
         check_references (bool): Whether to check references for errors
 
     Returns:
-        DocstringContext: A named tuple containing docstring processing context
+        FileContext: A named tuple containing file processing context
     """
 
     file_path: Path
-    line_no: int
-    name: str
-    verbose: bool
     require_param_types: bool = False
     check_references: bool = True
 
 
-def load_pyproject_config() -> dict[str, Any]:
+def load_pyproject_config() -> Mapping[str, Any]:
     """Load configuration from pyproject.toml if it exists.
 
+    The file is read once per location and modification time; later calls reuse the result until it changes.
+
     Returns:
-        dict[str, Any]: Dictionary with configuration values
+        Mapping[str, Any]: Read-only mapping with configuration values
     """
-    config = DEFAULT_CONFIG.copy()
-
     # Look for pyproject.toml in the current directory
     pyproject_path = Path("pyproject.toml")
     if not pyproject_path.is_file():
-        return config
+        return MappingProxyType(DEFAULT_CONFIG)
 
-    try:
-        with pyproject_path.open("rb") as f:
-            pyproject_data = tomli.load(f)
+    return _load_config_file(pyproject_path.resolve(), pyproject_path.stat().st_mtime_ns)
+
+
+def _read_tool_config(content: bytes, loads: Callable[[str], dict[str, Any]]) -> dict[str, Any]:
+    """Parse the [tool.docstring_checker] table out of pyproject.toml content.
+
+    When the table header is found, only the table itself is parsed, skipping the rest of the file.
+    The whole file is parsed when the header is absent (e.g. the table is written with dotted keys)
+    or when the slice is not valid TOML on its own.
 
+    Args:
+        content (bytes): Raw pyproject.toml content
+        loads (Callable[[str], dict[str, Any]]): TOML parser for a string
+
+    Returns:
+        dict[str, Any]: The checker's table, empty if it is not configured
+    """
+    start = 0 if content.startswith(TOOL_TABLE_HEADER) else content.find(b"\n" + TOOL_TABLE_HEADER) + 1
+    if start:
+        end = content.find(TABLE_HEADER_START, start + len(TOOL_TABLE_HEADER))
+        try:
+            pyproject_data = loads(content[start : end if end != -1 else len(content)].decode())
+        except ValueError:  # Decode and TOML errors; the slice cut through a multiline value
+            pass
+        else:
+            return pyproject_data.get("tool", {}).get("docstring_checker", {})
+
+    return loads(content.decode()).get("tool", {}).get("docstring_checker", {})
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_file(pyproject_path: Path, mtime_ns: int) -> Mapping[str, Any]:  # noqa: ARG001
+    """Load the docstring checker configuration from a pyproject.toml file.
+
+    Args:
+        pyproject_path (Path): Resolved path to pyproject.toml
+        mtime_ns (int): Modification time of the file, part of the cache key so edits are picked up
+
+    Returns:
+        Mapping[str, Any]: Read-only mapping with configuration values
+    """
+    config = DEFAULT_CONFIG.copy()
+
+    # Only pay for the TOML parser import when there is a file to read
+    if sys.version_info >= (3, 11):
+        import tomllib  # noqa: PLC0415
+    else:
+        import tomli as tomllib  # noqa: PLC0415
+
+    try:
         # Check if our tool is configured
-        tool_config = pyproject_data.get("tool", {}).get("docstring_checker", {})
+        tool_config = _read_tool_config(pyproject_path.read_bytes(), tomllib.loads)
         if not tool_config:
-            return config
+            return MappingProxyType(config)
 
         # Update config with values from pyproject.toml
-        if "paths" in tool_config:
-            config["paths"] = tool_config["paths"]
-        if "require_param_types" in tool_config:
-            config["require_param_types"] = bool(tool_config["require_param_types"])
-        if "check_references" in tool_config:
-            config["check_references"] = bool(tool_config["check_references"])
-        if "exclude_files" in tool_config:
-            config["exclude_files"] = tool_config["exclude_files"]
-        if "verbose" in tool_config:
-            config["verbose"] = bool(tool_config["verbose"])
+        for key, convert in CONFIG_CONVERTERS:
+            if key in tool_config:
+                value = tool_config[key]
+                config[key] = value if convert is None else convert(value)
 
     except Exception as e:
         print(f"Warning: Failed to load configuration from pyproject.toml: {e}")
 
-    return config
+    return MappingProxyType(config)
+
 
+def _iter_definitions(tree: ast.Module) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef]:
+    """Iterate over function and class definitions in source order.
 
-def get_docstrings(file_path: Path) -> list[tuple[str, int, str | None, ast.AST | None]]:
-    """Extract docstrings from a Python file.
+    Definitions can only appear as statements, so only the statement lists of each node
+    (bodies, except handlers, else/finally blocks, match cases) are followed.
 
     Args:
-        file_path (Path): Path to the Python file
+        tree (ast.Module): Parsed module
+
+    Yields:
+        ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef: Function and class definitions,
+            including nested ones
+    """
+    stack: list[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, DEFINITION_NODE_TYPES):
+            yield node
+        # Push in reverse so that nodes are popped in source order
+        for field in reversed(STATEMENT_LIST_FIELDS):
+            if children := getattr(node, field, None):
+                stack.extend(reversed(children))
+
+
+def _get_docstring(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> str | None:
+    """Get the cleaned docstring of a definition, equivalent to ast.get_docstring.
+
+    One-line docstrings without tabs only need leading whitespace removed, so
+    inspect.cleandoc is reserved for the rest.
+
+    Args:
+        node (ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef): Definition node
 
     Returns:
-        list[tuple[str, int, str | None, ast.AST | None]]: List of tuples containing:
-            - str: function/class name
-            - int: line number
-            - str | None: docstring
-            - ast.AST | None: AST node
+        str | None: The docstring, or None if the definition has none
     """
-    with file_path.open(encoding="utf-8") as f:
-        content = f.read()
+    if not node.body:
+        return None
+    first = node.body[0]
+    if not isinstance(first, ast.Expr) or not isinstance(first.value, ast.Constant):
+        return None
+    text = first.value.value
+    if not isinstance(text, str):
+        return None
+    if "\n" in text or "\t" in text:
+        return inspect.cleandoc(text)
+    return text.lstrip()
+
+
+def _parse_source(file_path: Path, content: bytes) -> ast.Module | None:
+    """Parse the content of a Python file that may contain docstrings.
 
+    The content is always decoded, so undecodable files are reported. Files that cannot contain a
+    docstring are not parsed, so a syntax error in such a file goes unreported.
+
+    Args:
+        file_path (Path): Path to the Python file, used in syntax errors
+        content (bytes): Raw content of the file
+
+    Returns:
+        ast.Module | None: Parsed module, or None if the file cannot contain any docstrings
+
+    Raises:
+        SyntaxError: If the file cannot be parsed
+        UnicodeDecodeError: If the file content cannot be decoded
+    """
+    # Decode first, honouring any PEP 263 encoding cookie, so decode errors are raised as such
+    # rather than reported by ast.parse as syntax errors
     try:
-        tree = ast.parse(content)
-    except SyntaxError as e:
-        print(f"Syntax error in {file_path}: {e}")
-        return []
+        source = importlib.util.decode_source(content)
+    except SyntaxError:
+        # Undecodable bytes in the first two lines are rejected as an invalid encoding declaration;
+        # decoding as UTF-8, the default, raises the underlying decode error instead
+        content.decode()
+        raise
+
+    # A docstring needs a definition and a string literal; skip parsing files that cannot have either,
+    # such as empty __init__.py files and modules of constants or re-exports
+    if ("def" not in source and "class" not in source) or ('"' not in source and "'" not in source):
+        return None
+
+    return ast.parse(source, filename=str(file_path))
+
 
+def _extract_docstrings(tree: ast.Module) -> list[tuple[str, int, str]]:
+    """Extract function and class docstrings from a parsed module.
+
+    Args:
+        tree (ast.Module): Parsed module
+
+    Returns:
+        list[tuple[str, int, str]]: List of (name, line number, docstring) tuples
+    """
     docstrings = []
 
     # Get function and class docstrings only
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-            docstring = ast.get_docstring(node)
-            if docstring:
-                docstrings.append((node.name, node.lineno, docstring, node))
+    for node in _iter_definitions(tree):
+        docstring = _get_docstring(node)
+        if docstring:
+            docstrings.append((node.name, node.lineno, docstring))
 
     return docstrings
 
 
+def _get_cache_file(cache_dir: Path, file_path: Path) -> Path:
+    """Get the cache file that holds the docstrings of a Python file.
+
+    Args:
+        cache_dir (Path): Cache directory
+        file_path (Path): Path to the Python file
+
+    Returns:
+        Path: Path to the cache file
+    """
+    key = hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _is_cached_docstring(item: object) -> bool:
+    """Check whether a decoded cache item has the shape of an extracted docstring.
+
+    Args:
+        item (object): Item decoded from a cache file
+
+    Returns:
+        bool: True if the item is a [name, line number, docstring] list
+    """
+    return isinstance(item, list) and [type(value) for value in item] == [str, int, str]
+
+
+def _load_cache_entry(cache_file: Path) -> tuple[tuple[int, ...], str, list[tuple[str, int, str]]] | None:
+    """Load a cache entry stored by a previous run.
+
+    Cache files are plain JSON and are validated before use, so a malformed or crafted file is
+    treated as a cache miss and never executes code.
+
+    Args:
+        cache_file (Path): Cache file to read
+
+    Returns:
+        tuple[tuple[int, ...], str, list[tuple[str, int, str]]] | None: Stamp, SHA-256 hex digest of
+            the file content and docstrings, or None if there is no valid entry
+    """
+    try:
+        with cache_file.open(encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+    stamp = entry.get("stamp")
+    digest = entry.get("digest")
+    docstrings = entry.get("docstrings")
+    if (
+        not isinstance(stamp, list)
+        or not all(isinstance(value, int) for value in stamp)
+        or not isinstance(digest, str)
+        or not isinstance(docstrings, list)
+        or not all(_is_cached_docstring(item) for item in docstrings)
+    ):
+        return None
+
+    return tuple(stamp), digest, [(name, line_no, docstring) for name, line_no, docstring in docstrings]
+
+
+def _store_cached_docstrings(
+    cache_file: Path,
+    stamp: tuple[int, ...],
+    digest: str,
+    docstrings: list[tuple[str, int, str]],
+) -> None:
+    """Store extracted docstrings in the cache, ignoring write failures.
+
+    Args:
+        cache_file (Path): Cache file to write
+        stamp (tuple[int, ...]): Cache version, Python version, modification time and size of the file
+        digest (str): SHA-256 hex digest of the file content
+        docstrings (list[tuple[str, int, str]]): Docstrings to cache
+    """
+    cache_dir = cache_file.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Created by check_docstrings\n*\n")
+
+        # Write to a temporary file first so parallel workers never read a partial cache file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "digest": digest, "docstrings": docstrings}, f)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+
+def get_docstrings(
+    file_path: Path,
+    cache_dir: Path | None = None,
+) -> list[tuple[str, int, str]]:
+    """Extract docstrings from a Python file, printing a message if it has a syntax error.
+
+    Args:
+        file_path (Path): Path to the Python file
+        cache_dir (Path | None): Directory to cache extracted docstrings in, None to disable caching
+
+    Returns:
+        list[tuple[str, int, str]]: List of tuples containing:
+            - str: function/class name
+            - int: line number
+            - str: docstring
+    """
+    docstrings, syntax_error = _read_docstrings(file_path, cache_dir)
+    if syntax_error:
+        print(syntax_error)
+    return docstrings
+
+
+def _read_docstrings(
+    file_path: Path,
+    cache_dir: Path | None,
+) -> tuple[list[tuple[str, int, str]], str | None]:
+    """Extract docstrings from a Python file without printing anything.
+
+    When a cache directory is given, docstrings are reused from a previous run as long as the
+    file's modification time and size are unchanged. Otherwise the file content is hashed, so a file
+    that was only touched or checked out again is not parsed either.
+
+    Args:
+        file_path (Path): Path to the Python file
+        cache_dir (Path | None): Directory to cache extracted docstrings in, None to disable caching
+
+    Returns:
+        tuple[list[tuple[str, int, str]], str | None]: Tuple containing:
+            - List of (function/class name, line number, docstring) tuples
+            - Message describing the file's syntax error, None if the file could be parsed
+    """
+    entry = None
+    if cache_dir is not None:
+        stat = file_path.stat()
+        stamp = (CACHE_VERSION, *sys.version_info[:2], stat.st_mtime_ns, stat.st_size)
+        cache_file = _get_cache_file(cache_dir, file_path)
+        entry = _load_cache_entry(cache_file)
+        if entry is not None and entry[0] == stamp:
+            return entry[2], None
+
+    content = file_path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest() if cache_dir is not None else ""
+    if entry is not None and entry[0][:3] == stamp[:3] and entry[1] == digest:
+        # Same content under a new modification time: refresh the stamp so the next run skips hashing
+        docstrings = entry[2]
+    else:
+        try:
+            tree = _parse_source(file_path, content)
+        except SyntaxError as e:
+            # Files with syntax errors are not cached, so the error is reported on every run
+            return [], f"Syntax error in {file_path}: {e}"
+        # The source is not needed once parsed; release it before walking the tree
+        del content
+        docstrings = _extract_docstrings(tree) if tree is not None else []
+
+    if cache_dir is not None:
+        _store_cached_docstrings(cache_file, stamp, digest, docstrings)
+    return docstrings, None
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_parse(docstring: str) -> dict[str, Any]:
+    """Parse a docstring, reusing the result for identical docstrings.
+
+    The returned dictionary is shared between calls and must not be modified.
+
+    Args:
+        docstring (str): The docstring to parse
+
+    Returns:
+        dict[str, Any]: Parsed docstring dictionary
+    """
+    return parse_google_docstring(docstring)
+
+
 def check_param_types(docstring_dict: dict[str, Any], require_types: bool) -> list[str]:
     """Check if all parameters have types if required.
 
@@ -185,34 +571,68 @@ def check_references(docstring_dict: dict[str, Any]) -> list[str]:
     Returns:
         list[str]: List of error messages for problematic references
     """
+    # Check for References section, falling back to the singular form
+    ref_section = "References"
+    references = docstring_dict.get(ref_section)
+    if references is None:
+        ref_section = "Reference"
+        references = docstring_dict.get(ref_section)
+        if references is None:
+            return []
+
+    # Check if references is a list
+    if not isinstance(references, list):
+        return [f"{ref_section} section is not properly formatted"]
+
     errors = []
 
-    # Check for References section
-    for ref_section in ["References", "Reference"]:
-        if ref_section in docstring_dict:
-            references = docstring_dict[ref_section]
+    # Check each reference
+    for i, ref in enumerate(references):
+        if not isinstance(ref, dict):
+            errors.append(f"Reference #{i + 1} is not properly formatted")
+            continue
 
-            # Check if references is a list
-            if not isinstance(references, list):
-                errors.append(f"{ref_section} section is not properly formatted")
-                return errors
+        errors.extend(_check_reference_fields(ref, i))
 
-            # If no references, that's fine
-            if not references:
-                return errors
+    return errors
 
-            # Check each reference
-            for i, ref in enumerate(references):
-                if not isinstance(ref, dict):
-                    errors.append(f"Reference #{i + 1} is not properly formatted")
-                    continue
 
-                errors.extend(_check_reference_fields(ref, i))
+@functools.lru_cache(maxsize=4096)
+def _scan_docstring(docstring: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Run the line-level checks on a docstring in a single regex pass.
 
-            # We've processed one references section, no need to check the other
-            break
+    Results are reused for identical docstrings, so they are returned as tuples.
 
-    return errors
+    Args:
+        docstring (str): The docstring to check
+
+    Returns:
+        tuple[tuple[str, ...], tuple[str, ...]]: Tuple containing:
+            - Error messages for incorrect Returns section names
+            - Error messages for malformed parameter types
+    """
+    returns_errors: list[str] = []
+    format_errors: list[str] = []
+
+    # Every check needs either a parenthesis or a Returns header
+    if "(" not in docstring and "return" not in docstring and "Return" not in docstring:
+        return (), ()
+
+    for match in DOCSTRING_LINE_PATTERN.finditer(docstring):
+        if match["returns"]:
+            returns_errors.append(f"Invalid section name '{match['returns']}', use 'Returns:' instead")
+            continue
+
+        line_end = docstring.find("\n", match.start())
+        stripped_line = docstring[match.start() : line_end if line_end != -1 else len(docstring)].strip()
+        if match["unclosed"]:
+            format_errors.append(f"Unclosed parenthesis in parameter type: '{stripped_line}'")
+            # A line can have both an unclosed bracket and an invalid type
+            if not INVALID_TYPE_PATTERN.match(stripped_line):
+                continue
+        format_errors.append(f"Invalid type declaration: '{stripped_line}'")
+
+    return tuple(returns_errors), tuple(format_errors)
 
 
 def validate_docstring(docstring: str) -> list[str]:
@@ -224,29 +644,7 @@ def validate_docstring(docstring: str) -> list[str]:
     Returns:
         list[str]: List of validation error messages
     """
-    errors = []
-
-    # Check for unclosed parentheses in parameter types
-    lines = docstring.split("\n")
-    for line in lines:
-        stripped_line = line.strip()
-        if not stripped_line:
-            continue
-
-        # Check for parameter definitions with unclosed parentheses
-        # Improved regex to better detect unclosed parentheses and brackets
-        if param_match := re.match(
-            r"^\s*(\w+)\s+\(([^)]*$|.*\[[^\]]*$)",
-            stripped_line,
-        ):
-            errors.append(f"Unclosed parenthesis in parameter type: '{stripped_line}'")
-
-        # Check for invalid type declarations
-        param_match = re.match(r"^\s*(\w+)\s+\((invalid type)\)", stripped_line)
-        if param_match:
-            errors.append(f"Invalid type declaration: '{stripped_line}'")
-
-    return errors
+    return list(_scan_docstring(docstring)[1])
 
 
 def check_returns_section_name(docstring: str) -> list[str]:
@@ -258,13 +656,7 @@ def check_returns_section_name(docstring: str) -> list[str]:
     Returns:
         list[str]: List of error messages for incorrect Returns section names
     """
-    errors = []
-    lines = docstring.split("\n")
-    for line in lines:
-        stripped = line.strip()
-        if stripped in ["return:", "Return:", "returns:"]:
-            errors.append(f"Invalid section name '{stripped}', use 'Returns:' instead")
-    return errors
+    return list(_scan_docstring(docstring)[0])
 
 
 def check_returns_type(docstring_dict: dict[str, Any]) -> list[str]:
@@ -285,24 +677,24 @@ def check_returns_type(docstring_dict: dict[str, Any]) -> list[str]:
     return errors
 
 
-def _format_error(context: DocstringContext, error: str) -> str:
+def _format_error(context: FileContext, name: str, line_no: int, error: str) -> str:
     """Format an error message consistently.
 
     Args:
-        context (DocstringContext): Docstring context
+        context (FileContext): File context
+        name (str): Name of the function or class
+        line_no (int): Line number
         error (str): Error message
 
     Returns:
         str: Formatted error message
     """
-    msg = f"{context.file_path}:{context.line_no}: {error} in '{context.name}'"
-    if context.verbose:
-        print(msg)
-    return msg
+    return f"{context.file_path}:{line_no}: {error} in '{name}'"
 
 
 def safe_execute(
-    context: DocstringContext,
+    context: FileContext,
+    location: tuple[str, int],
     func: callable,
     *args,  # noqa: ANN002
     error_prefix: str,
@@ -311,7 +703,8 @@ def safe_execute(
     """Safely execute a function and handle errors consistently.
 
     Args:
-        context (DocstringContext): Context for error formatting
+        context (FileContext): Context for error formatting
+        location (tuple[str, int]): Name of the function or class and its line number
         func (callable): Function to execute
         *args (Any): Arguments to pass to the function
         error_prefix (str): Prefix for error messages
@@ -322,59 +715,29 @@ def safe_execute(
             - List of error messages
             - Result of the function if successful, None otherwise
     """
+    name, line_no = location
     try:
         result = func(*args)
     except Exception as e:
-        return ([_format_error(context, f"{error_prefix}: {e}")], None)
+        return ([_format_error(context, name, line_no, f"{error_prefix}: {e}")], None)
 
     if format_results and isinstance(result, list):
-        return ([_format_error(context, err) for err in result], None)
+        return ([_format_error(context, name, line_no, err) for err in result], None)
     return ([], result)
 
 
-def _check_returns_section(context: DocstringContext, docstring: str) -> list[str]:
-    """Check the Returns section name.
-
-    Args:
-        context (DocstringContext): Docstring context
-        docstring (str): The docstring to process
-
-    Returns:
-        list[str]: List of error messages
-    """
-    errors, _ = safe_execute(
-        context,
-        check_returns_section_name,
-        docstring,
-        error_prefix="Error checking Returns section name",
-    )
-    return errors
-
-
-def _validate_docstring_format(context: DocstringContext, docstring: str) -> list[str]:
-    """Validate docstring format.
-
-    Args:
-        context (DocstringContext): Docstring context
-        docstring (str): The docstring to process
-
-    Returns:
-        list[str]: List of error messages
-    """
-    errors, _ = safe_execute(
-        context,
-        validate_docstring,
-        docstring,
-        error_prefix="Error validating docstring",
-    )
-    return errors
-
-
-def _parse_and_check_returns(context: DocstringContext, docstring: str) -> tuple[list[str], dict[str, Any] | None]:
+def _parse_and_check_returns(
+    context: FileContext,
+    name: str,
+    line_no: int,
+    docstring: str,
+) -> tuple[list[str], dict[str, Any] | None]:
     """Parse docstring and check returns type.
 
     Args:
-        context (DocstringContext): Docstring context
+        context (FileContext): File context
+        name (str): Name of the function or class
+        line_no (int): Line number
         docstring (str): The docstring to process
 
     Returns:
@@ -383,11 +746,13 @@ def _parse_and_check_returns(context: DocstringContext, docstring: str) -> tuple
             - Parsed docstring dictionary if successful, None otherwise
     """
     errors = []
+    location = (name, line_no)
 
     # Parse docstring
     parse_errors, parsed = safe_execute(
         context,
-        parse_google_docstring,
+        location,
+        _cached_parse,
         docstring,
         error_prefix="Error parsing docstring",
         format_results=False,
@@ -398,6 +763,7 @@ def _parse_and_check_returns(context: DocstringContext, docstring: str) -> tuple
     # Check returns type
     returns_errors, _ = safe_execute(
         context,
+        location,
         check_returns_type,
         parsed,
         error_prefix="Error checking Returns type",
@@ -407,21 +773,25 @@ def _parse_and_check_returns(context: DocstringContext, docstring: str) -> tuple
     return errors, parsed
 
 
-def _check_additional_validations(context: DocstringContext, parsed: dict[str, Any]) -> list[str]:
+def _check_additional_validations(context: FileContext, name: str, line_no: int, parsed: dict[str, Any]) -> list[str]:
     """Run additional validations on parsed docstring.
 
     Args:
-        context (DocstringContext): Docstring context
+        context (FileContext): File context
+        name (str): Name of the function or class
+        line_no (int): Line number
         parsed (dict[str, Any]): Parsed docstring
 
     Returns:
         list[str]: List of error messages
     """
     errors = []
+    location = (name, line_no)
 
     if context.require_param_types:
         type_errors, _ = safe_execute(
             context,
+            location,
             check_param_types,
             parsed,
             context.require_param_types,
@@ -432,6 +802,7 @@ def _check_additional_validations(context: DocstringContext, parsed: dict[str, A
     if context.check_references:
         ref_errors, _ = safe_execute(
             context,
+            location,
             check_references,
             parsed,
             error_prefix="Error checking references",
@@ -441,11 +812,13 @@ def _check_additional_validations(context: DocstringContext, parsed: dict[str, A
     return errors
 
 
-def _process_docstring(context: DocstringContext, docstring: str) -> list[str]:
+def _process_docstring(context: FileContext, name: str, line_no: int, docstring: str) -> list[str]:
     """Process a single docstring.
 
     Args:
-        context (DocstringContext): Docstring context
+        context (FileContext): File context
+        name (str): Name of the function or class
+        line_no (int): Line number
         docstring (str): The docstring to process
 
     Returns:
@@ -454,25 +827,26 @@ def _process_docstring(context: DocstringContext, docstring: str) -> list[str]:
     if not docstring:
         return []
 
-    errors = []
-
-    # Check Returns section name
-    errors.extend(_check_returns_section(context, docstring))
-
-    # Validate docstring format
-    format_errors = _validate_docstring_format(context, docstring)
-    errors.extend(format_errors)
+    # Check Returns section name and validate docstring format in one pass. The regex-based
+    # checks cannot raise, so they are called directly rather than via safe_execute
+    returns_errors, format_errors = _scan_docstring(docstring)
+    errors = [_format_error(context, name, line_no, error) for error in (*returns_errors, *format_errors)]
     if format_errors:
         return errors
 
+    # Without a colon there is no section header, so the parsed docstring is just a description
+    # and none of the checks below can report anything
+    if ":" not in docstring:
+        return errors
+
     # Parse and check returns
-    parse_errors, parsed = _parse_and_check_returns(context, docstring)
+    parse_errors, parsed = _parse_and_check_returns(context, name, line_no, docstring)
     errors.extend(parse_errors)
     if not parsed:
         return errors
 
     # Run additional validations
-    errors.extend(_check_additional_validations(context, parsed))
+    errors.extend(_check_additional_validations(context, name, line_no, parsed))
 
     return errors
 
@@ -482,6 +856,7 @@ def check_file(
     require_param_types: bool = False,
     verbose: bool = False,
     check_references: bool = True,
+    cache_dir: Path | None = None,
 ) -> list[str]:
     """Check docstrings in a file.
 
@@ -490,6 +865,7 @@ def check_file(
         require_param_types (bool): Whether parameter types are required
         verbose (bool): Whether to print verbose output
         check_references (bool): Whether to check references for errors
+        cache_dir (Path | None): Directory to cache extracted docstrings in, None to disable caching
 
     Returns:
         list[str]: List of error messages
@@ -497,37 +873,234 @@ def check_file(
     if verbose:
         print(f"Checking {file_path}")
 
-    errors = []
+    options = CheckOptions(require_param_types, check_references, cache_dir=cache_dir)
+    syntax_error, errors = _check_file_quietly(file_path, options)
+    if syntax_error:
+        print(syntax_error)
+
+    # Print the file's errors in a single write rather than one print per error
+    if verbose and errors:
+        print("\n".join(errors))
+
+    return errors
+
+
+def _check_file_quietly(file_path: Path, options: CheckOptions) -> tuple[str | None, list[str]]:
+    """Check docstrings in a file without printing anything, so it can run in a worker process.
+
+    Args:
+        file_path (Path): Path to the Python file
+        options (CheckOptions): Options for checking the file
 
+    Returns:
+        tuple[str | None, list[str]]: Tuple containing:
+            - Message describing the file's syntax error, None if the file could be parsed
+            - List of error messages
+    """
     try:
-        docstrings = get_docstrings(file_path)
+        docstrings, syntax_error = _read_docstrings(file_path, options.cache_dir)
     except Exception as e:
-        error_msg = f"{file_path}: Error getting docstrings: {e!s}"
-        errors.append(error_msg)
-        if verbose:
-            print(error_msg)
-        return errors
+        return None, [f"{file_path}: Error getting docstrings: {e!s}"]
 
-    for name, line_no, docstring, _ in docstrings:
-        context = DocstringContext(
-            file_path=file_path,
-            line_no=line_no,
-            name=name,
-            verbose=verbose,
-            require_param_types=require_param_types,
-            check_references=check_references,
-        )
-        errors.extend(_process_docstring(context, docstring))
+    context = FileContext(
+        file_path=file_path,
+        require_param_types=options.require_param_types,
+        check_references=options.check_references,
+    )
+    errors = []
+    for name, line_no, docstring in docstrings:
+        errors.extend(_process_docstring(context, name, line_no, docstring))
+    return syntax_error, errors
+
+
+class ExcludePatterns(NamedTuple):
+    """Exclude patterns, split by how they are matched.
+
+    Args:
+        names (frozenset[str]): Filenames excluded wherever they appear
+        dirs (frozenset[str]): Names of directories skipped when scanning
+        suffixes (tuple[str, ...]): Path suffixes matched with str.endswith
+        name_glob (re.Pattern[str] | None): Wildcard patterns matched against the filename, compiled into
+            one regex, or None if there are none
+        path_glob (re.Pattern[str] | None): Wildcard patterns matched against the end of the path, compiled
+            into one regex, or None if there are none
+
+    Returns:
+        ExcludePatterns: A named tuple containing the split exclude patterns
+    """
+
+    names: frozenset[str]
+    dirs: frozenset[str]
+    suffixes: tuple[str, ...]
+    name_glob: re.Pattern[str] | None
+    path_glob: re.Pattern[str] | None
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile shell-style wildcard patterns into a single regex matching any of them.
+
+    Args:
+        patterns (list[str]): Wildcard patterns
+
+    Returns:
+        re.Pattern[str] | None: Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _split_exclude_patterns(exclude_files: list[str], exclude_dirs: Iterable[str] | None = None) -> ExcludePatterns:
+    """Split exclude patterns by how they are matched, so each file is checked with cheap lookups first.
+
+    Args:
+        exclude_files (list[str]): Filenames (e.g. "conftest.py"), paths ending with a filename
+            (e.g. "tests/conftest.py"), or either of those with shell-style wildcards
+            (e.g. "test_*.py", "tests/fixtures/*.py") to exclude
+        exclude_dirs (Iterable[str] | None): Names of directories to skip when scanning,
+            None to use DEFAULT_EXCLUDE_DIRS
+
+    Returns:
+        ExcludePatterns: The split exclude patterns
+    """
+    plain = [pattern for pattern in exclude_files if not GLOB_CHARS.intersection(pattern)]
+    globs = [pattern for pattern in exclude_files if GLOB_CHARS.intersection(pattern)]
+    return ExcludePatterns(
+        names=frozenset(plain),
+        dirs=frozenset(DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs),
+        suffixes=tuple(f"/{pattern}" for pattern in plain if "/" in pattern),
+        name_glob=_compile_globs([pattern for pattern in globs if "/" not in pattern]),
+        path_glob=_compile_globs([f"*/{pattern}" for pattern in globs if "/" in pattern]),
+    )
+
+
+def _is_excluded(exclude: ExcludePatterns, name: str, path_str: str) -> bool:
+    """Check whether a file matches any exclude pattern.
+
+    Args:
+        exclude (ExcludePatterns): Exclude patterns
+        name (str): Filename
+        path_str (str): Path of the file
+
+    Returns:
+        bool: True if the file is excluded
+    """
+    return (
+        name in exclude.names
+        or path_str.endswith(exclude.suffixes)
+        or (exclude.name_glob is not None and exclude.name_glob.match(name) is not None)
+        or (exclude.path_glob is not None and exclude.path_glob.match(path_str) is not None)
+    )
+
+
+def _check_files(files: list[Path], options: CheckOptions, verbose: bool) -> list[str]:
+    """Check docstrings in a list of files, using worker processes for larger lists.
+
+    Args:
+        files (list[Path]): Python files to check
+        options (CheckOptions): Options for checking the files
+        verbose (bool): Whether to print verbose output
+
+    Returns:
+        list[str]: List of error messages, in the order of the files
+    """
+    # Files are checked quietly, possibly in worker processes; all output is printed here by the
+    # parent, in file order, with one write per file
+    check = functools.partial(_check_file_quietly, options=options)
+
+    workers = min(options.jobs or os.cpu_count() or 1, len(files))
+    if workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+        return _gather_errors(files, map(check, files), verbose)
+
+    # Only pay for importing multiprocessing when worker processes are used
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
 
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _gather_errors(files, executor.map(check, files, chunksize=chunksize), verbose)
+
+
+def _gather_errors(
+    files: list[Path],
+    results: Iterable[tuple[str | None, list[str]]],
+    verbose: bool,
+) -> list[str]:
+    """Combine the errors of checked files, printing syntax errors and, in verbose mode, each file's progress.
+
+    Args:
+        files (list[Path]): Checked files
+        results (Iterable[tuple[str | None, list[str]]]): Syntax error message and error messages of each
+            file, in the order of the files
+        verbose (bool): Whether to print verbose output
+
+    Returns:
+        list[str]: List of error messages, in the order of the files
+    """
+    errors = []
+    for file_path, (syntax_error, file_errors) in zip(files, results):
+        lines = [f"Checking {file_path}"] if verbose else []
+        if syntax_error:
+            lines.append(syntax_error)
+        if verbose:
+            lines.extend(file_errors)
+        if lines:
+            print("\n".join(lines))
+        errors.extend(file_errors)
     return errors
 
 
-def scan_directory(
+def _collect_directory_files(directory: Path, exclude: ExcludePatterns) -> list[Path]:
+    """Collect the Python files in a directory that are not excluded.
+
+    Hidden directories, directories listed in PRUNED_DIRECTORIES and excluded directories are
+    skipped. Like Path.glob("**"), symlinked directories are not followed, while symlinked files are
+    checked.
+
+    Args:
+        directory (Path): Directory to scan
+        exclude (ExcludePatterns): Patterns of files and directories to exclude
+
+    Returns:
+        list[Path]: Python files to check
+    """
+    files = []
+    # Walk with os.scandir, whose entries already know whether they are directories, so no extra
+    # stat calls are needed. Directories are visited depth-first in sorted order.
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not name.startswith(".") and name not in PRUNED_DIRECTORIES and name not in exclude.dirs:
+                    subdirectories.append(entry.path)
+            elif name.endswith(PYTHON_FILE_SUFFIXES) and entry.is_file():
+                py_file = Path(entry.path)
+                if not _is_excluded(exclude, name, str(py_file)):
+                    files.append(py_file)
+
+        # Push in reverse so that subdirectories are popped in sorted order
+        stack.extend(reversed(subdirectories))
+    return files
+
+
+# The public signature is kept as it was; options added later are keyword-only
+def scan_directory(  # noqa: PLR0913
     directory: Path,
     exclude_files: list[str] | None = None,
     require_param_types: bool = False,
     verbose: bool = False,
     check_references: bool = True,
+    *,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+    exclude_dirs: list[str] | None = None,
 ) -> list[str]:
     """Scan a directory for Python files and check their docstrings.
 
@@ -537,30 +1110,15 @@ def scan_directory(
         require_param_types (bool): Whether parameter types are required
         verbose (bool): Whether to print verbose output
         check_references (bool): Whether to check references for errors
+        jobs (int | None): Maximum number of worker processes, None to use the number of CPUs
+        cache_dir (Path | None): Directory to cache extracted docstrings in, None to disable caching
+        exclude_dirs (list[str] | None): Names of directories to skip, None to use DEFAULT_EXCLUDE_DIRS
 
     Returns:
         list[str]: List of error messages
     """
-    if exclude_files is None:
-        exclude_files = []
-
-    errors = []
-    for py_file in directory.glob("**/*.py"):
-        # Check if the file should be excluded
-        should_exclude = False
-        for exclude_pattern in exclude_files:
-            # Check if the filename matches exactly
-            if py_file.name == exclude_pattern:
-                should_exclude = True
-                break
-            # Check if the path ends with the pattern (for subdirectories)
-            if str(py_file).endswith(f"/{exclude_pattern}"):
-                should_exclude = True
-                break
-
-        if not should_exclude:
-            errors.extend(check_file(py_file, require_param_types, verbose, check_references))
-    return errors
+    files = _collect_directory_files(directory, _split_exclude_patterns(exclude_files or [], exclude_dirs))
+    return _check_files(files, CheckOptions(require_param_types, check_references, jobs, cache_dir), verbose)
 
 
 def _parse_args() -> argparse.Namespace:
@@ -569,6 +1127,9 @@ def _parse_args() -> argparse.Namespace:
     Returns:
         argparse.Namespace: Parsed command line arguments
     """
+    # Only needed when run as a script, not when the checks are imported
+    import argparse  # noqa: PLC0415
+
     parser = argparse.ArgumentParser(
         description="Check that docstrings in specified folders can be parsed.",
     )
@@ -594,30 +1155,57 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--exclude-files",
-        help="Comma-separated list of filenames to exclude",
+        help="Comma-separated list of filenames to exclude, shell-style wildcards are supported",
         default="",
     )
+    parser.add_argument(
+        "--exclude-dirs",
+        help=(
+            "Comma-separated list of directory names to skip when scanning, an empty value skips none "
+            f"(defaults to {','.join(DEFAULT_EXCLUDE_DIRS)})"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes (defaults to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache extracted docstrings between runs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not cache extracted docstrings, even if enabled in the config",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Cache extracted docstrings in this directory (defaults to {DEFAULT_CACHE_DIR})",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     return parser.parse_args()
 
 
 def _get_config_values(
     args: argparse.Namespace,
-    config: dict[str, Any],
-) -> tuple[list[str], bool, bool, bool, list[str]]:
+    config: Mapping[str, Any],
+) -> tuple[list[str], CheckOptions, bool, list[str], list[str] | None]:
     """Get configuration values from command line arguments and config file.
 
     Args:
         args (argparse.Namespace): Command line arguments
-        config (dict[str, Any]): Configuration dictionary
+        config (Mapping[str, Any]): Configuration values
 
     Returns:
-        tuple[list[str], bool, bool, bool, list[str]]: Tuple containing:
+        tuple[list[str], CheckOptions, bool, list[str], list[str] | None]: Tuple containing:
             - List of paths to check
-            - Whether to require parameter types
-            - Whether to check references
+            - Options for checking the files
             - Whether to enable verbose output
             - List of files to exclude
+            - List of directory names to skip, None to use DEFAULT_EXCLUDE_DIRS
     """
     # Get paths
     paths = args.paths or config["paths"]
@@ -636,48 +1224,82 @@ def _get_config_values(
         check_references = False
 
     # Get exclude_files
-    exclude_files = []
-    if args.exclude_files:
-        exclude_files = [f.strip() for f in args.exclude_files.split(",") if f.strip()]
-
     # If no exclude_files specified on command line, use the ones from config
-    if not exclude_files:
-        exclude_files = config["exclude_files"]
+    exclude_files = [f for f in map(str.strip, (args.exclude_files or "").split(",")) if f] or config["exclude_files"]
+
+    # Get exclude_dirs - an empty value on the command line skips no directories
+    exclude_dirs = config["exclude_dirs"]
+    if args.exclude_dirs is not None:
+        exclude_dirs = [d for d in map(str.strip, args.exclude_dirs.split(",")) if d]
+
+    # Get jobs
+    jobs = args.jobs if args.jobs is not None else config["jobs"]
+
+    # Get cache directory - caching is opt-in via a flag, the environment or the config
+    env_cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    cache_dir = None
+    if (args.cache or args.cache_dir or env_cache_dir or config["cache"]) and not args.no_cache:
+        cache_dir = Path(args.cache_dir or env_cache_dir or config["cache_dir"] or DEFAULT_CACHE_DIR)
 
-    return paths, require_param_types, verbose, check_references, exclude_files
+    options = CheckOptions(require_param_types, check_references, jobs, cache_dir)
+    return paths, options, verbose, exclude_files, exclude_dirs
 
 
 def _process_paths(
     paths: list[str],
     exclude_files: list[str],
-    require_param_types: bool,
-    verbose: bool,
-    check_references: bool,
+    options: CheckOptions,
+    verbose: bool = False,
+    exclude_dirs: list[str] | None = None,
 ) -> list[str]:
     """Process paths and check docstrings.
 
     Args:
         paths (list[str]): List of paths to check
         exclude_files (list[str]): List of files to exclude
-        require_param_types (bool): Whether parameter types are required
+        options (CheckOptions): Options for checking the files
         verbose (bool): Whether to print verbose output
-        check_references (bool): Whether to check references for errors
+        exclude_dirs (list[str] | None): Names of directories to skip, None to use DEFAULT_EXCLUDE_DIRS
 
     Returns:
         list[str]: List of error messages
     """
-    all_errors = []
+    # Gather the files from all paths first, so that files passed individually on the command line
+    # are checked by the same worker processes as files found in directories
+    exclude = _split_exclude_patterns(exclude_files, exclude_dirs)
+
+    files = []
     for path_str in paths:
         path = Path(path_str)
         if path.is_dir():
-            errors = scan_directory(path, exclude_files, require_param_types, verbose, check_references)
-            all_errors.extend(errors)
-        elif path.is_file() and path.suffix == ".py":
-            errors = check_file(path, require_param_types, verbose, check_references)
-            all_errors.extend(errors)
+            files.extend(_collect_directory_files(path, exclude))
+        elif path.name.endswith(PYTHON_FILE_SUFFIXES) and path.is_file():
+            files.append(path)
         else:
             print(f"Error: {path} is not a directory or Python file")
-    return all_errors
+
+    return _check_files(_unique_files(files), options, verbose)
+
+
+def _unique_files(files: list[Path]) -> list[Path]:
+    """Drop files reached more than once through overlapping paths (e.g. "src" and "src/module.py").
+
+    Args:
+        files (list[Path]): Files to check, possibly with repeats
+
+    Returns:
+        list[Path]: The first occurrence of each file, in order
+    """
+    cwd = Path.cwd()
+    seen: set[str] = set()
+    unique = []
+    for file_path in files:
+        # Compare normalized absolute paths, computed without touching the filesystem
+        key = os.path.normpath(cwd / file_path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(file_path)
+    return unique
 
 
 def main() -> None:
@@ -693,15 +1315,18 @@ def main() -> None:
     args = _parse_args()
 
     # Get configuration values
-    paths, require_param_types, verbose, check_references, exclude_files = _get_config_values(args, config)
+    paths, options, verbose, exclude_files, exclude_dirs = _get_config_values(args, config)
 
     # Print configuration if verbose
     if verbose:
         print("Configuration:")
         print(f"  Paths: {paths}")
-        print(f"  Require parameter types: {require_param_types}")
-        print(f"  Check references: {check_references}")
+        print(f"  Require parameter types: {options.require_param_types}")
+        print(f"  Check references: {options.check_references}")
         print(f"  Exclude files: {exclude_files}")
+        print(f"  Exclude dirs: {list(DEFAULT_EXCLUDE_DIRS) if exclude_dirs is None else exclude_dirs}")
+        print(f"  Jobs: {options.jobs or os.cpu_count()}")
+        print(f"  Cache: {options.cache_dir or 'disabled'}")
 
     # Check if paths is empty
     if not paths:
@@ -711,15 +1336,9 @@ def main() -> None:
         )
         sys.exit(0)
 
-    if all_errors := _process_paths(
-        paths,
-        exclude_files,
-        require_param_types,
-        verbose,
-        check_references,
-    ):
-        for error in all_errors:
-            print(error)
+    if all_errors := _process_paths(paths, exclude_files, options, verbose, exclude_dirs):
+        # Print all errors with one write rather than one print per error
+        print("\n".join(all_errors))
         print(f"\nFound {len(all_errors)} error{'s' if len(all_errors) != 1 else ''}")
         sys.exit(1)
     elif verbose: